@@ -36,6 +36,7 @@ from pybyd.models import (
     HvacStatus,
     LockState,
     OnlineState,
+    PollOptions,
     PowerGear,
     PushNotificationState,
     RemoteControlResult,
@@ -90,6 +91,7 @@ __all__ = [
     "HvacStatus",
     "LockState",
     "OnlineState",
+    "PollOptions",
     "PowerGear",
     "PushNotificationState",
     "RemoteControlResult",
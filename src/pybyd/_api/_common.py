@@ -11,12 +11,13 @@ It is internal to pyBYD and may change at any time.
 
 from __future__ import annotations
 
-import json
 import logging
+import random
 import secrets
 import time
 from typing import Any
 
+from pybyd import _json
 from pybyd._api._envelope import build_token_outer_envelope
 from pybyd._constants import SESSION_EXPIRED_CODES
 from pybyd._crypto.aes import aes_decrypt_utf8
@@ -34,6 +35,34 @@ _logger = logging.getLogger(__name__)
 #: API error codes indicating the endpoint is not supported for this vehicle.
 ENDPOINT_NOT_SUPPORTED_CODES: frozenset[str] = frozenset({"1001"})
 
+#: Upper bound for a single backed-off poll delay, in seconds.
+POLL_MAX_INTERVAL: float = 10.0
+
+
+def poll_delay(
+    attempt: int,
+    interval: float,
+    *,
+    backoff: float = 1.0,
+    jitter: float = 0.0,
+    max_interval: float = POLL_MAX_INTERVAL,
+) -> float:
+    """Seconds to wait before poll *attempt* (1-based).
+
+    The delay starts at *interval* and grows geometrically by *backoff*
+    per attempt, capped at *max_interval* (or *interval* if larger).
+    *jitter* spreads the result uniformly by ``±jitter`` (a fraction).
+    With the defaults this is simply *interval* for every attempt.
+    """
+    if interval <= 0:
+        return 0.0
+    delay = interval
+    if backoff != 1.0:
+        delay = min(interval * backoff ** (attempt - 1), max(interval, max_interval))
+    if jitter > 0:
+        delay *= random.uniform(1.0 - jitter, 1.0 + jitter)
+    return delay
+
 
 def build_inner_base(
     config: BydConfig,
@@ -44,7 +73,7 @@ def build_inner_base(
 ) -> dict[str, str]:
     """Build common inner payload fields used by most BYD endpoints."""
     if now_ms is None:
-        now_ms = int(time.time() * 1000)
+        now_ms = time.time_ns() // 1_000_000
 
     inner: dict[str, str] = {
         "deviceType": config.device.device_type,
@@ -121,8 +150,8 @@ def decode_respond_data(
     if not plaintext or not plaintext.strip():
         return {}
     try:
-        decoded = json.loads(plaintext)
-    except json.JSONDecodeError as exc:
+        decoded = _json.loads(plaintext)
+    except _json.JSONDecodeError as exc:
         raise BydApiError(
             f"{endpoint} respondData is not JSON: {plaintext[:128]}",
             code="invalid_json",
@@ -152,7 +181,7 @@ async def post_token_json(
     since BYD endpoints may return objects or lists.
     """
     if now_ms is None:
-        now_ms = int(time.time() * 1000)
+        now_ms = time.time_ns() // 1_000_000
 
     outer, content_key = build_token_outer_envelope(config, session, inner, now_ms, user_type=user_type)
 
@@ -5,10 +5,10 @@ Ports buildTokenOuterEnvelope from client.js lines 288-315.
 
 from __future__ import annotations
 
-import json
 import time
 from typing import Any
 
+from pybyd import _json
 from pybyd._crypto.aes import aes_encrypt_hex
 from pybyd._crypto.hashing import compute_checkcode, sha1_mixed
 from pybyd._crypto.signing import build_sign_string
@@ -48,10 +48,7 @@ def build_token_outer_envelope(
     content_key = session.content_key()
     sign_key = session.sign_key()
 
-    encry_data = aes_encrypt_hex(
-        json.dumps(inner, separators=(",", ":")),
-        content_key,
-    )
+    encry_data = aes_encrypt_hex(_json.dumps(inner), content_key)
 
     sign_fields: dict[str, str] = {
         **inner,
@@ -77,7 +74,7 @@ def build_token_outer_envelope(
         "model": config.device.model,
         "sdk": config.device.sdk,
         "mod": config.device.mod,
-        "serviceTime": str(int(time.time() * 1000)),
+        "serviceTime": str(time.time_ns() // 1_000_000),
     }
     if user_type is not None:
         outer["userType"] = user_type
@@ -11,12 +11,13 @@ PIN set in the BYD app) and must **not** include ``instructionCode``.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import time
 from collections.abc import Awaitable, Callable
 from typing import Any
 
-from pybyd._api._common import ENDPOINT_NOT_SUPPORTED_CODES, build_inner_base, post_token_json
+from pybyd import _json
+from pybyd._api._common import ENDPOINT_NOT_SUPPORTED_CODES, build_inner_base, poll_delay, post_token_json
 from pybyd._transport import Transport
 from pybyd.config import BydConfig
 from pybyd.exceptions import (
@@ -71,11 +72,7 @@ def _build_control_inner(
     inner["commandPwd"] = command_pwd or ""
     inner["commandType"] = command.value
     if control_params is not None:
-        inner["controlParamsMap"] = json.dumps(
-            control_params,
-            separators=(",", ":"),
-            sort_keys=True,
-        )
+        inner["controlParamsMap"] = _json.dumps(control_params, sort_keys=True)
     return inner
 
 
@@ -196,6 +193,9 @@ async def poll_remote_control(
     command_pwd: str | None = None,
     poll_attempts: int = 10,
     poll_interval: float = 1.5,
+    poll_backoff: float = 1.0,
+    poll_jitter: float = 0.15,
+    first_poll_delay: float | None = None,
     rate_limit_retries: int = 3,
     rate_limit_delay: float = 5.0,
     command_retries: int = 3,
@@ -223,7 +223,15 @@ async def poll_remote_control(
     poll_attempts : int
         Maximum number of result poll attempts.
     poll_interval : float
-        Seconds between poll attempts.
+        Seconds to wait before each poll attempt; with *poll_backoff*
+        this is the starting delay it grows from.
+    poll_backoff : float
+        Factor the poll delay grows by per attempt (``1.0`` = fixed).
+    poll_jitter : float
+        Random spread applied to each poll delay, as a fraction.
+    first_poll_delay : float or None
+        Seconds before the first poll attempt when it should come
+        sooner than *poll_interval*; ``None`` uses *poll_interval*.
     rate_limit_retries : int
         How many times to retry the initial trigger when the server
         returns code 6024 ("previous command still in progress").
@@ -263,6 +271,9 @@ async def poll_remote_control(
                 command_pwd=command_pwd,
                 poll_attempts=poll_attempts,
                 poll_interval=poll_interval,
+                poll_backoff=poll_backoff,
+                poll_jitter=poll_jitter,
+                first_poll_delay=first_poll_delay,
                 rate_limit_retries=rate_limit_retries,
                 rate_limit_delay=rate_limit_delay,
                 mqtt_result_waiter=mqtt_result_waiter,
@@ -295,6 +306,9 @@ async def _poll_remote_control_once(
     command_pwd: str | None = None,
     poll_attempts: int = 10,
     poll_interval: float = 1.5,
+    poll_backoff: float = 1.0,
+    poll_jitter: float = 0.15,
+    first_poll_delay: float | None = None,
     rate_limit_retries: int = 3,
     rate_limit_delay: float = 5.0,
     mqtt_result_waiter: Callable[[str | None], Awaitable[RemoteControlResult | None]] | None = None,
@@ -356,6 +370,7 @@ async def _poll_remote_control_once(
         _logger.debug("Remote control %s request returned without serial; using immediate result", command.name)
         return parse_remote_control_result_data(result if isinstance(result, dict) else {})
 
+    triggered_at = time.monotonic()
     if mqtt_result_waiter is not None:
         try:
             mqtt_result = await mqtt_result_waiter(serial)
@@ -374,8 +389,14 @@ async def _poll_remote_control_once(
     # Phase 2: Poll for results
     latest = result
     for attempt in range(1, poll_attempts + 1):
-        if poll_interval > 0:
-            await asyncio.sleep(poll_interval)
+        delay = poll_delay(attempt, poll_interval, backoff=poll_backoff, jitter=poll_jitter)
+        if attempt == 1:
+            if first_poll_delay is not None:
+                delay = first_poll_delay
+            # Time already spent waiting on MQTT counts towards the first poll.
+            delay -= time.monotonic() - triggered_at
+        if delay > 0:
+            await asyncio.sleep(delay)
 
         try:
             latest, serial = await _fetch_control_endpoint(
@@ -14,6 +14,7 @@ import secrets
 import time
 from typing import Any
 
+from pybyd import _json
 from pybyd._crypto.aes import aes_decrypt_utf8, aes_encrypt_hex
 from pybyd._crypto.hashing import compute_checkcode, md5_hex, pwd_login_key, sha1_mixed
 from pybyd._crypto.signing import build_sign_string
@@ -36,24 +37,27 @@ def _common_outer_fields(config: BydConfig) -> dict[str, str]:
     }
 
 
-def build_login_request(config: BydConfig, now_ms: int) -> dict[str, Any]:
+def build_login_request(config: BydConfig, now_ms: int | None = None) -> dict[str, Any]:
     """Build the outer payload for the login endpoint.
 
     Parameters
     ----------
     config : BydConfig
         Client configuration.
-    now_ms : int
-        Current time in milliseconds since epoch.
+    now_ms : int or None
+        Current time in milliseconds since epoch. Defaults to the
+        current time.
 
     Returns
     -------
     dict
         The outer payload ready for Bangcle encoding.
     """
+    if now_ms is None:
+        now_ms = time.time_ns() // 1_000_000
     random_hex = secrets.token_hex(16).upper()
     req_timestamp = str(now_ms)
-    service_time = str(int(time.time() * 1000))
+    service_time = str(time.time_ns() // 1_000_000)
 
     inner: dict[str, str] = {
         "appInnerVersion": config.app_inner_version,
@@ -148,7 +152,7 @@ def parse_login_response(
         )
 
     plaintext = aes_decrypt_utf8(respond_data, pwd_login_key(password))
-    inner = json.loads(plaintext)
+    inner = _json.loads(plaintext)
     _logger.debug("HTTP decoded endpoint=/app/account/login plaintext=%s", plaintext)
     token = inner.get("token") if isinstance(inner, dict) else None
 
@@ -28,7 +28,7 @@ async def fetch_realtime_endpoint(
     request_serial: str | None = None,
 ) -> tuple[dict[str, Any], str | None]:
     """Fetch a single realtime endpoint, returning (vehicle_info_dict, next_serial)."""
-    now_ms = int(time.time() * 1000)
+    now_ms = time.time_ns() // 1_000_000
     inner = build_inner_base(config, now_ms=now_ms, vin=vin, request_serial=request_serial)
     inner["energyType"] = "0"
     inner["tboxVersion"] = config.tbox_version
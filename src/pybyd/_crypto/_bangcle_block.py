@@ -9,7 +9,6 @@ libencrypt.so rather than a standard AES key schedule.
 
 from __future__ import annotations
 
-import struct
 from typing import NamedTuple
 
 
@@ -63,6 +62,9 @@ def decrypt_block_auth(
 
     _prepare_aes_matrix(block, state)
     param3 = round_start
+    inv_round = tables.inv_round
+    inv_xor = tables.inv_xor
+    perm = tables.perm_decrypt
 
     for rnd in range(9, max(0, param3 - 1), -1):
         l_var20 = rnd
@@ -70,16 +72,16 @@ def decrypt_block_auth(
         perm_ptr = 0
 
         for i in range(4):
-            b_var3 = tables.perm_decrypt[perm_ptr]
+            b_var3 = perm[perm_ptr]
             l_var16 = i * 8
             base = i * 16
 
             for j in range(4):
                 u_var7 = (b_var3 + j) & 3
                 byte_val = state[l_var16 + u_var7]
-                idx = byte_val + (i + (l_var21 + u_var7) * 4) * 256
-                value = struct.unpack_from("<I", tables.inv_round, idx * 4)[0]
-                struct.pack_into("<I", temp64, base + j * 4, value)
+                idx = (byte_val + (i + (l_var21 + u_var7) * 4) * 256) * 4
+                # Copy the little-endian u32 table entry byte for byte.
+                temp64[base + j * 4 : base + j * 4 + 4] = inv_round[idx : idx + 4]
 
             perm_ptr += 2
 
@@ -89,37 +91,22 @@ def decrypt_block_auth(
 
             for l_var9_xor in range(4):
                 local10 = temp64[pb_var18_offset]
-                u_var6 = local10 & 0xF
-                u_var26 = local10 & 0xF0
-
                 local_f0 = temp64[pb_var18_offset + 0x10]
                 local_f1 = temp64[pb_var18_offset + 0x20]
                 local_f2 = temp64[pb_var18_offset + 0x30]
 
-                l_var2 = l_var9_xor * 0x18 + l_var20 * 0x60
-                i_var25 = i_var15
-
-                for l_var16 in range(3):
-                    if l_var16 == 0:
-                        b_var3_inner = local_f0
-                    elif l_var16 == 1:
-                        b_var3_inner = local_f1
-                    else:
-                        b_var3_inner = local_f2
-
-                    u_var1 = (b_var3_inner << 4) & 0xFF
-                    u_var27 = u_var6 | u_var1
-                    u_var26 = ((u_var26 >> 4) | ((b_var3_inner >> 4) << 4)) & 0xFF
-
-                    idx1 = (l_var2 + (i_var25 - 1)) * 0x100 + u_var27
-                    u_var6 = tables.inv_xor[idx1] & 0xF
-
-                    idx2 = (l_var2 + i_var25) * 0x100 + u_var26
-                    b_var3_new = tables.inv_xor[idx2]
-                    u_var26 = (b_var3_new & 0xF) << 4
-                    i_var25 += 2
-
-                state[l_var9_xor + l_var21_xor * 8] = (u_var26 | u_var6) & 0xFF
+                # XOR the four T-box bytes through six nibble tables: the
+                # low and high nibbles are folded separately, alternating
+                # tables, one pair of lookups per remaining byte.
+                t = (l_var9_xor * 0x18 + l_var20 * 0x60 + i_var15 - 1) * 0x100
+                lo = inv_xor[t + (local10 & 0xF | (local_f0 & 0xF) << 4)] & 0xF
+                hi = inv_xor[t + 0x100 + (local10 >> 4 | local_f0 & 0xF0)] & 0xF
+                lo = inv_xor[t + 0x200 + (lo | (local_f1 & 0xF) << 4)] & 0xF
+                hi = inv_xor[t + 0x300 + (hi | local_f1 & 0xF0)] & 0xF
+                lo = inv_xor[t + 0x400 + (lo | (local_f2 & 0xF) << 4)] & 0xF
+                hi = inv_xor[t + 0x500 + (hi | local_f2 & 0xF0)] & 0xF
+
+                state[l_var9_xor + l_var21_xor * 8] = hi << 4 | lo
                 pb_var18_offset += 4
 
             i_var15 += 6
@@ -187,6 +174,9 @@ def encrypt_block_auth(
 
     _prepare_aes_matrix(block, state)
     param3 = round_end
+    round_table = tables.round
+    xor_table = tables.xor
+    perm = tables.perm_encrypt
 
     rounds = min(9, max(0, param3))
     for rnd in range(rounds):
@@ -194,16 +184,16 @@ def encrypt_block_auth(
         perm_ptr = 0
 
         for i in range(4):
-            b_var4 = tables.perm_encrypt[perm_ptr]
+            b_var4 = perm[perm_ptr]
             l_var16 = i * 8
             base = i * 16
 
             for j in range(4):
                 u_var8 = (b_var4 + j) & 3
                 byte_val = state[l_var16 + u_var8]
-                idx = byte_val + (i + (l_var21 + u_var8) * 4) * 256
-                value = struct.unpack_from("<I", tables.round, idx * 4)[0]
-                struct.pack_into("<I", temp64, base + j * 4, value)
+                idx = (byte_val + (i + (l_var21 + u_var8) * 4) * 256) * 4
+                # Copy the little-endian u32 table entry byte for byte.
+                temp64[base + j * 4 : base + j * 4 + 4] = round_table[idx : idx + 4]
 
             perm_ptr += 2
 
@@ -213,37 +203,20 @@ def encrypt_block_auth(
 
             for l_var10 in range(4):
                 local10 = temp64[pb_var19_offset]
-                u_var7 = local10 & 0xF
-                u_var26 = local10 & 0xF0
-
                 local_f0 = temp64[pb_var19_offset + 0x10]
                 local_f1 = temp64[pb_var19_offset + 0x20]
                 local_f2 = temp64[pb_var19_offset + 0x30]
 
-                l_var2 = l_var10 * 0x18 + rnd * 0x60
-                i_var25 = i_var16
-
-                for l_var17 in range(3):
-                    if l_var17 == 0:
-                        b_var4_inner = local_f0
-                    elif l_var17 == 1:
-                        b_var4_inner = local_f1
-                    else:
-                        b_var4_inner = local_f2
-
-                    u_var1 = (b_var4_inner << 4) & 0xFF
-                    u_var27 = u_var7 | u_var1
-                    u_var26 = ((u_var26 >> 4) | ((b_var4_inner >> 4) << 4)) & 0xFF
-
-                    idx1 = (l_var2 + (i_var25 - 1)) * 0x100 + u_var27
-                    u_var7 = tables.xor[idx1] & 0xF
-
-                    idx2 = (l_var2 + i_var25) * 0x100 + u_var26
-                    b_var4_new = tables.xor[idx2]
-                    u_var26 = (b_var4_new & 0xF) << 4
-                    i_var25 += 2
+                # Same nibble-table XOR network as in decrypt_block_auth.
+                t = (l_var10 * 0x18 + rnd * 0x60 + i_var16 - 1) * 0x100
+                lo = xor_table[t + (local10 & 0xF | (local_f0 & 0xF) << 4)] & 0xF
+                hi = xor_table[t + 0x100 + (local10 >> 4 | local_f0 & 0xF0)] & 0xF
+                lo = xor_table[t + 0x200 + (lo | (local_f1 & 0xF) << 4)] & 0xF
+                hi = xor_table[t + 0x300 + (hi | local_f1 & 0xF0)] & 0xF
+                lo = xor_table[t + 0x400 + (lo | (local_f2 & 0xF) << 4)] & 0xF
+                hi = xor_table[t + 0x500 + (hi | local_f2 & 0xF0)] & 0xF
 
-                state[l_var10 + l_var22 * 8] = (u_var26 | u_var7) & 0xFF
+                state[l_var10 + l_var22 * 8] = hi << 4 | lo
                 pb_var19_offset += 4
 
             i_var16 += 6
@@ -275,10 +248,9 @@ def encrypt_block_auth(
     return bytes(output)
 
 
-def _xor_into(target: bytearray, source: bytes | bytearray) -> None:
-    """XOR source into target in-place."""
-    for i in range(len(target)):
-        target[i] ^= source[i]
+def _xor16(a: bytes | bytearray, b: bytes | bytearray) -> bytes:
+    """XOR two 16-byte blocks."""
+    return (int.from_bytes(a, "little") ^ int.from_bytes(b, "little")).to_bytes(16, "little")
 
 
 def decrypt_cbc(tables: BangcleTables, data: bytes, iv: bytes) -> bytes:
@@ -309,14 +281,12 @@ def decrypt_cbc(tables: BangcleTables, data: bytes, iv: bytes) -> bytes:
         raise ValueError(f"IV must be 16 bytes, got {len(iv)}")
 
     result = bytearray(len(data))
-    prev = bytearray(iv)
+    prev = iv
 
     for offset in range(0, len(data), 16):
         block = data[offset : offset + 16]
-        decrypted = bytearray(decrypt_block_auth(tables, block, 1))
-        _xor_into(decrypted, prev)
-        result[offset : offset + 16] = decrypted
-        prev[:] = block
+        result[offset : offset + 16] = _xor16(decrypt_block_auth(tables, block, 1), prev)
+        prev = block
 
     return bytes(result)
 
@@ -349,13 +319,11 @@ def encrypt_cbc(tables: BangcleTables, data: bytes, iv: bytes) -> bytes:
         raise ValueError(f"IV must be 16 bytes, got {len(iv)}")
 
     result = bytearray(len(data))
-    prev = bytearray(iv)
+    prev = iv
 
     for offset in range(0, len(data), 16):
-        block = bytearray(data[offset : offset + 16])
-        _xor_into(block, prev)
-        encrypted = encrypt_block_auth(tables, block, 10)
+        encrypted = encrypt_block_auth(tables, _xor16(data[offset : offset + 16], prev), 10)
         result[offset : offset + 16] = encrypted
-        prev[:] = encrypted
+        prev = encrypted
 
     return bytes(result)
@@ -0,0 +1,44 @@
+"""Compact JSON encoding/decoding for the HTTP hot path.
+
+Uses :mod:`orjson` when it is installed (``pip install pybyd[speedups]``)
+and falls back to the standard library otherwise.  Both backends emit
+the same compact, non-ASCII-escaped JSON and raise
+:class:`json.JSONDecodeError` (``orjson.JSONDecodeError`` is a subclass)
+on invalid input.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(value: Any, *, sort_keys: bool = False) -> str:
+    """Serialise *value* to a compact JSON string.
+
+    With *sort_keys*, object keys are emitted in sorted order.
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS if sort_keys else 0).decode("utf-8")
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, sort_keys=sort_keys)
+
+
+def dumpb(value: Any) -> bytes:
+    """Serialise *value* to compact UTF-8 encoded JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: str | bytes) -> Any:
+    """Deserialise a JSON document from *data*."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import json
 import logging
 import time
 from collections.abc import Callable
@@ -13,6 +12,7 @@ from typing import Any, cast
 import paho.mqtt.client as mqtt
 from pydantic import BaseModel, ConfigDict
 
+from pybyd import _json
 from pybyd._api._common import build_inner_base, post_token_json
 from pybyd._crypto.aes import aes_decrypt_utf8
 from pybyd._crypto.hashing import md5_hex
@@ -108,7 +108,7 @@ async def fetch_mqtt_bootstrap(
     broker = await _fetch_emq_broker(config, session, transport)
     broker_host, broker_port = _parse_broker(broker)
     client_id = _build_client_id(config)
-    now_seconds = int(time.time())
+    now_seconds = time.time_ns() // 1_000_000_000
     return MqttBootstrap(
         user_id=session.user_id,
         broker_host=broker_host,
@@ -131,7 +131,7 @@ def decode_mqtt_payload(payload: bytes, decrypt_key_hex: str) -> tuple[dict[str,
     raw_text = payload.decode("ascii", errors="replace")
     raw_text = "".join(raw_text.split())
     plain = aes_decrypt_utf8(raw_text, decrypt_key_hex)
-    parsed = json.loads(plain)
+    parsed = _json.loads(plain)
     if not isinstance(parsed, dict):
         raise BydError("MQTT payload decrypted to non-object JSON")
     return parsed, plain
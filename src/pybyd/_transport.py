@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import contextlib
 import logging
 from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any, Protocol
 
 import aiohttp
+from yarl import URL
 
+from pybyd import _json
 from pybyd._constants import USER_AGENT
 from pybyd._crypto.bangcle import BangcleCodec
 from pybyd.config import BydConfig
@@ -16,6 +20,20 @@ from pybyd.exceptions import BydTransportError
 
 _logger = logging.getLogger(__name__)
 
+# Identical for every request, so built once rather than per call.
+_REQUEST_HEADERS: Mapping[str, str] = MappingProxyType(
+    {
+        "accept-encoding": "identity",
+        "content-type": "application/json; charset=UTF-8",
+        "user-agent": USER_AGENT,
+    }
+)
+
+
+def _preview(raw: bytes, limit: int) -> str:
+    """Return the first *limit* characters of *raw* for error messages."""
+    return raw[: limit * 4].decode("utf-8", errors="replace")[:limit]
+
 
 class Transport(Protocol):
     """Structural transport interface used by endpoint modules.
@@ -30,16 +48,23 @@ class Transport(Protocol):
 class SecureTransport:
     """HTTP transport that handles Bangcle envelope encoding.
 
-    Cookie persistence is delegated to the ``aiohttp.ClientSession``'s
-    built-in ``CookieJar`` — callers should create the session with
-    ``cookie_jar=aiohttp.CookieJar(unsafe=True)`` for single-host APIs.
+    The BYD API does not rely on cookies; callers supplying their own
+    ``aiohttp.ClientSession`` should create it with
+    ``cookie_jar=aiohttp.DummyCookieJar()`` to keep long-lived sessions
+    from accumulating cookie state.
+
+    The HTTP session can be swapped with :meth:`attach_session` and
+    :meth:`detach_session`, so a transport outlives the session it was
+    created with and keeps its URL cache.  The request slots are
+    rebuilt on every attach, since an asyncio semaphore is bound to the
+    event loop that first waited on it.
     """
 
     def __init__(
         self,
         config: BydConfig,
         codec: BangcleCodec,
-        http_session: aiohttp.ClientSession,
+        http_session: aiohttp.ClientSession | None = None,
         *,
         logger: logging.Logger | None = None,
     ) -> None:
@@ -47,6 +72,32 @@ class SecureTransport:
         self._codec = codec
         self._http = http_session
         self._logger = logger or _logger
+        # Parsed request URL per endpoint; the set of endpoints is small and fixed.
+        self._urls: dict[str, URL] = {}
+        self._request_slots = self._new_request_slots()
+
+    def _new_request_slots(self) -> contextlib.AbstractAsyncContextManager[Any]:
+        """Build the limiter for requests in flight.
+
+        A burst of concurrent calls queues here instead of piling onto
+        the BYD backend.
+        """
+        limit = self._config.max_concurrent_requests
+        return asyncio.Semaphore(limit) if limit > 0 else contextlib.nullcontext()
+
+    @property
+    def is_attached(self) -> bool:
+        """Whether an HTTP session is attached."""
+        return self._http is not None
+
+    def attach_session(self, http_session: aiohttp.ClientSession) -> None:
+        """Send subsequent requests through *http_session*."""
+        self._http = http_session
+        self._request_slots = self._new_request_slots()
+
+    def detach_session(self) -> None:
+        """Drop the HTTP session; requests fail until one is attached."""
+        self._http = None
 
     async def post_secure(self, endpoint: str, outer_payload: Mapping[str, Any]) -> dict[str, Any]:
         """Send a signed request through the Bangcle envelope layer.
@@ -57,25 +108,24 @@ class SecureTransport:
         4. Bangcle-decode the ``{"response": "<encoded>"}`` reply
         5. Return the decoded JSON dict
         """
-        encoded = self._codec.encode_envelope(json.dumps(outer_payload, separators=(",", ":")))
-
-        headers: dict[str, str] = {
-            "accept-encoding": "identity",
-            "content-type": "application/json; charset=UTF-8",
-            "user-agent": USER_AGENT,
-        }
+        http = self._http
+        if http is None:
+            raise BydTransportError(f"No HTTP session attached for {endpoint}", endpoint=endpoint)
+        encoded = self._codec.encode_envelope(_json.dumps(outer_payload))
 
-        url = f"{self._config.base_url}{endpoint}"
-        body = json.dumps({"request": encoded})
+        url = self._urls.get(endpoint)
+        if url is None:
+            url = self._urls[endpoint] = URL(f"{self._config.base_url}{endpoint}")
+        body = _json.dumpb({"request": encoded})
 
         self._logger.debug("HTTP POST %s", url)
 
         try:
-            async with self._http.post(url, data=body, headers=headers) as resp:
-                text = await resp.text()
+            async with self._request_slots, http.post(url, data=body, headers=_REQUEST_HEADERS) as resp:
+                raw = await resp.read()
                 if resp.status != 200:
                     raise BydTransportError(
-                        f"HTTP {resp.status} from {endpoint}: {text[:200]}",
+                        f"HTTP {resp.status} from {endpoint}: {_preview(raw, 200)}",
                         status_code=resp.status,
                         endpoint=endpoint,
                     )
@@ -86,12 +136,17 @@ class SecureTransport:
                 f"Request to {endpoint} failed: {exc}",
                 endpoint=endpoint,
             ) from exc
+        except TimeoutError as exc:
+            raise BydTransportError(
+                f"Request to {endpoint} timed out",
+                endpoint=endpoint,
+            ) from exc
 
         try:
-            body_json = json.loads(text)
-        except json.JSONDecodeError as exc:
+            body_json = _json.loads(raw)
+        except (_json.JSONDecodeError, UnicodeDecodeError) as exc:
             raise BydTransportError(
-                f"Invalid JSON from {endpoint}: {text[:200]}",
+                f"Invalid JSON from {endpoint}: {_preview(raw, 200)}",
                 endpoint=endpoint,
             ) from exc
 
@@ -108,17 +163,17 @@ class SecureTransport:
                 endpoint=endpoint,
             )
 
-        decoded_text = self._codec.decode_envelope(response_str).decode("utf-8").strip()
+        decoded = self._codec.decode_envelope(response_str).strip()
 
         # Handle stray F prefix on decoded JSON (observed in some responses)
-        if decoded_text.startswith("F{") or decoded_text.startswith("F["):
-            decoded_text = decoded_text[1:]
+        if decoded.startswith((b"F{", b"F[")):
+            decoded = decoded[1:]
 
         try:
-            result: dict[str, Any] = json.loads(decoded_text)
-        except json.JSONDecodeError as exc:
+            result: dict[str, Any] = _json.loads(decoded)
+        except (_json.JSONDecodeError, UnicodeDecodeError) as exc:
             raise BydTransportError(
-                f"Bangcle response from {endpoint} is not JSON: {decoded_text[:64]}",
+                f"Bangcle response from {endpoint} is not JSON: {_preview(decoded, 64)}",
                 endpoint=endpoint,
             ) from exc
 
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
 import logging
+import re
 import time
-from collections.abc import Awaitable, Callable, Mapping
+from collections.abc import Awaitable, Callable, Coroutine, Hashable, Iterable, Mapping
 from dataclasses import dataclass, field
 from typing import Any, TypeVar
 
@@ -22,6 +24,7 @@ from pybyd._api import realtime as _realtime_api
 from pybyd._api import smart_charging as _smart_api
 from pybyd._api import vehicle as _vehicle_api
 from pybyd._api import vehicle_settings as _settings_api
+from pybyd._api._common import poll_delay
 from pybyd._api.login import build_login_request, parse_login_response
 from pybyd._crypto.bangcle import BangcleCodec
 from pybyd._crypto.hashing import md5_hex
@@ -37,6 +40,7 @@ from pybyd.models.control import (
     ClimateStartParams,
     CommandAck,
     ControlParams,
+    PollOptions,
     RemoteCommand,
     RemoteControlResult,
     SeatClimateParams,
@@ -48,6 +52,7 @@ from pybyd.models.hvac import HvacStatus
 from pybyd.models.push_notification import PushNotificationState
 from pybyd.models.realtime import VehicleRealtimeData
 from pybyd.models.smart_charging import SmartChargingSchedule
+from pybyd.models.token import AuthToken
 from pybyd.models.vehicle import Vehicle
 from pybyd.session import Session
 
@@ -56,6 +61,11 @@ _logger = logging.getLogger(__name__)
 T = TypeVar("T")
 _M = TypeVar("_M", bound=BydBaseModel)
 
+# A control password that is already an MD5 hex digest.
+_MD5_HEX_RE = re.compile(r"[0-9a-fA-F]{32}")
+
+_DEFAULT_POLL = PollOptions()
+
 
 @dataclass(slots=True)
 class _MqttWaiter:
@@ -74,9 +84,22 @@ class _MqttWaiter:
     created_at: float = field(default_factory=time.monotonic)
 
 
-def _now_ms() -> int:
-    """Current epoch timestamp in milliseconds."""
-    return int(time.time() * 1000)
+@dataclass(slots=True)
+class _InFlight:
+    """A call shared by concurrent callers (see ``BydClient._single_flight``)."""
+
+    task: asyncio.Task[Any]
+    waiters: int = 0
+
+
+@functools.cache
+def _shared_codec() -> BangcleCodec:
+    """Return the process-wide Bangcle codec.
+
+    The codec only holds the read-only white-box tables, so every client
+    can share one instance and the tables are loaded once per process.
+    """
+    return BangcleCodec()
 
 
 class BydClient:
@@ -91,26 +114,63 @@ class BydClient:
 
     _REMOTE_CONTROL_OPPORTUNISTIC_WINDOW_S: float = 2.0
 
+    # HTTP connection pool tuning for the client-owned session.  The
+    # client only ever talks to a single API host, so resolved addresses
+    # are cached well beyond aiohttp's 10 s default and idle keep-alive
+    # connections are held long enough to span typical polling gaps.
+    _HTTP_DNS_CACHE_TTL_S: int = 300
+    _HTTP_POOL_LIMIT: int = 10
+    _HTTP_POOL_LIMIT_PER_HOST: int = 4
+    _HTTP_KEEPALIVE_TIMEOUT_S: float = 75.0
+    _HTTP_TOTAL_TIMEOUT_S: float = 30.0
+    _HTTP_CONNECT_TIMEOUT_S: float = 10.0
+    # How long login() waits for the warm-up request; a stalled one must
+    # not hold up login by the whole session timeout.
+    _WARM_UP_WAIT_S: float = 2.0
+
     def __init__(
         self,
         config: BydConfig,
         *,
         session: aiohttp.ClientSession | None = None,
+        connector: aiohttp.BaseConnector | None = None,
+        cookie_jar: aiohttp.abc.AbstractCookieJar | None = None,
         on_vehicle_info: Callable[[str, VehicleRealtimeData], None] | None = None,
         on_mqtt_event: Callable[[str, str, dict[str, Any]], None] | None = None,
+        auth_token: AuthToken | None = None,
+        on_auth_token: Callable[[AuthToken], None] | None = None,
     ) -> None:
         self._config = config
+        # BydConfig is frozen, so the hashed PIN never changes.
+        self._control_pin_md5 = md5_hex(config.control_pin) if config.control_pin else ""
         self._external_session = session is not None
         self._http_session = session
-        self._codec = BangcleCodec()
+        self._connector = connector
+        self._cookie_jar = cookie_jar
+        # Bound on start; see _shared_codec().
+        self._codec: BangcleCodec | None = None
         self._transport: SecureTransport | None = None
         self._session: Session | None = None
+        self._login_lock = asyncio.Lock()
         self._loop: asyncio.AbstractEventLoop | None = None
         self._mqtt_runtime: BydMqttRuntime | None = None
         self._mqtt_waiters: list[_MqttWaiter] = []
         self._mqtt_reauth_at: float = 0.0
+        self._pending_writes: set[asyncio.Task[Any]] = set()
+        self._warm_up_task: asyncio.Task[None] | None = None
+        # Last fetched model per (model class, VIN) with its monotonic fetch time.
+        self._last_reads: dict[tuple[type[BydBaseModel], str], tuple[float, BydBaseModel]] = {}
+        # Bumped per VIN by _forget, so reads started before it are not remembered.
+        self._read_generations: dict[str, int] = {}
+        # Reads currently on the wire, joined by identical concurrent reads
+        # (see _single_flight).
+        self._inflight: dict[Hashable, _InFlight] = {}
         self._on_vehicle_info = on_vehicle_info
         self._on_mqtt_event_cb = on_mqtt_event
+        # Token persisted by the caller from an earlier run; used at most
+        # once, in place of the first login, and never after one.
+        self._restored_token = auth_token
+        self._on_auth_token = on_auth_token
 
     # ------------------------------------------------------------------
     # Context manager lifecycle
@@ -130,29 +190,88 @@ class BydClient:
         also be invoked directly when the lifecycle is managed manually.
         """
         self._loop = asyncio.get_running_loop()
+        # A fresh lock per start: asyncio locks bind to the loop that first
+        # waits on them, and a closed client may be restarted on another.
+        self._login_lock = asyncio.Lock()
         if self._http_session is None:
-            self._http_session = aiohttp.ClientSession(
-                cookie_jar=aiohttp.CookieJar(unsafe=True),
+            self._http_session = self._create_http_session()
+        if self._codec is None:
+            self._codec = _shared_codec()
+        # Re-entering a closed client reuses its transport; only the
+        # HTTP session is swapped.
+        if self._transport is None:
+            self._transport = SecureTransport(self._config, self._codec, logger=_logger)
+        self._transport.attach_session(self._http_session)
+        if self._config.warm_up_connection and self._warm_up_task is None:
+            self._warm_up_task = self._loop.create_task(self._warm_up_connection(self._http_session))
+        await self._codec.async_load_tables()
+
+    async def _warm_up_connection(self, http: aiohttp.ClientSession) -> None:
+        """Open a keep-alive connection to the API host ahead of login.
+
+        The response itself is irrelevant; any failure is left for the
+        first real request to report.
+        """
+        with contextlib.suppress(aiohttp.ClientError, asyncio.TimeoutError):
+            async with http.head(self._config.base_url, allow_redirects=False) as resp:
+                _logger.debug("Connection warm-up to %s: HTTP %s", self._config.base_url, resp.status)
+
+    def _create_http_session(self) -> aiohttp.ClientSession:
+        """Build the client-owned HTTP session.
+
+        A caller-supplied ``connector`` is shared, not owned: it is left
+        open when the session closes so other clients can keep using it.
+        The BYD API does not use cookies, so unless a ``cookie_jar`` was
+        supplied a ``DummyCookieJar`` is attached to avoid the per-cookie
+        expiry timers of the default jar.
+        """
+        connector = self._connector
+        connector_owner = connector is None
+        if connector is None:
+            connector = aiohttp.TCPConnector(
+                limit=self._HTTP_POOL_LIMIT,
+                limit_per_host=self._HTTP_POOL_LIMIT_PER_HOST,
+                keepalive_timeout=self._HTTP_KEEPALIVE_TIMEOUT_S,
+                use_dns_cache=True,
+                ttl_dns_cache=self._HTTP_DNS_CACHE_TTL_S,
             )
-        self._transport = SecureTransport(
-            self._config,
-            self._codec,
-            self._http_session,
-            logger=_logger,
+        return aiohttp.ClientSession(
+            connector=connector,
+            connector_owner=connector_owner,
+            timeout=aiohttp.ClientTimeout(
+                total=self._HTTP_TOTAL_TIMEOUT_S,
+                connect=self._HTTP_CONNECT_TIMEOUT_S,
+            ),
+            cookie_jar=self._cookie_jar if self._cookie_jar is not None else aiohttp.DummyCookieJar(),
         )
-        await self._codec.async_load_tables()
 
     async def async_close(self) -> None:
         """Tear down the client transport and MQTT connection.
 
+        Background writes are drained; shared reads still in flight are
+        cancelled.
+
         Called automatically by ``async with BydClient(...)``, but can
         also be invoked directly when the lifecycle is managed manually.
         """
+        if self._pending_writes:
+            # asyncio.wait leaves failures unretrieved for their owners.
+            await asyncio.wait(self._pending_writes)
+        if self._inflight:
+            flights = [flight.task for flight in self._inflight.values()]
+            for task in flights:
+                task.cancel()
+            await asyncio.gather(*flights, return_exceptions=True)
+        if self._warm_up_task is not None:
+            self._warm_up_task.cancel()
+            await asyncio.gather(self._warm_up_task, return_exceptions=True)
+            self._warm_up_task = None
         self._stop_mqtt()
         if not self._external_session and self._http_session is not None:
             await self._http_session.close()
             self._http_session = None
-        self._transport = None
+        if self._transport is not None:
+            self._transport.detach_session()
         self._loop = None
 
     # ------------------------------------------------------------------
@@ -162,10 +281,24 @@ class BydClient:
     async def login(self) -> None:
         """Authenticate against the BYD API and obtain session tokens."""
         transport = self._require_transport()
-        outer = build_login_request(self._config, _now_ms())
+        if self._warm_up_task is not None:
+            # Reuse the warmed connection instead of racing it with a second
+            # handshake, unless warming up is taking too long.
+            await asyncio.wait({self._warm_up_task}, timeout=self._WARM_UP_WAIT_S)
+        outer = build_login_request(self._config)
         response = await transport.post_secure("/app/account/login", outer)
         token = parse_login_response(response, self._config.password)
+        await self._start_session(token)
+        if self._on_auth_token is not None:
+            try:
+                self._on_auth_token(token)
+            except Exception:
+                _logger.debug("on_auth_token callback failed", exc_info=True)
 
+    async def _start_session(self, token: AuthToken) -> None:
+        """Install a session for *token* and (re)start MQTT with its key."""
+        # Any session supersedes the persisted token, so a later re-auth logs in.
+        self._restored_token = None
         ttl = self._config.session_ttl if self._config.session_ttl > 0 else float("inf")
         self._session = Session(
             user_id=token.user_id,
@@ -182,12 +315,28 @@ class BydClient:
         await self._ensure_mqtt_started()
 
     async def ensure_session(self) -> Session:
-        """Return an active session, re-authenticating if expired."""
-        if self._session is not None and not self._session.is_expired:
-            return self._session
-        await self.login()
-        assert self._session is not None  # noqa: S101
-        return self._session
+        """Return an active session, re-authenticating if expired.
+
+        Concurrent callers that find the session missing share a single
+        login: whoever acquires the lock first re-authenticates and the
+        rest pick up its session.  The first session is built from the
+        ``auth_token`` passed to the constructor, if any, without a login
+        round-trip; if the API rejects it, the usual re-auth retry logs in.
+        """
+        session = self._session
+        if session is not None and not session.is_expired:
+            return session
+        async with self._login_lock:
+            session = self._session
+            if session is None or session.is_expired:
+                restored = self._restored_token
+                if restored is not None and session is None:
+                    await self._start_session(restored)
+                else:
+                    await self.login()
+                session = self._session
+        assert session is not None  # noqa: S101
+        return session
 
     def invalidate_session(self) -> None:
         """Force session invalidation (next call will re-authenticate)."""
@@ -198,7 +347,7 @@ class BydClient:
     # ------------------------------------------------------------------
 
     def _require_transport(self) -> SecureTransport:
-        if self._transport is None:
+        if self._transport is None or not self._transport.is_attached:
             raise BydError("Client not initialized. Use 'async with BydClient(...) as client:'")
         return self._transport
 
@@ -206,12 +355,10 @@ class BydClient:
         """Normalize control password (uppercase MD5 hex of PIN)."""
         if command_pwd is not None:
             stripped = command_pwd.strip()
-            if len(stripped) == 32 and all(ch in "0123456789abcdefABCDEF" for ch in stripped):
+            if _MD5_HEX_RE.fullmatch(stripped):
                 return stripped.upper()
             return md5_hex(stripped)
-        if self._config.control_pin:
-            return md5_hex(self._config.control_pin)
-        return ""
+        return self._control_pin_md5
 
     def _require_command_pwd(self, command_pwd: str | None) -> str:
         resolved = self._resolve_command_pwd(command_pwd)
@@ -220,12 +367,20 @@ class BydClient:
         return resolved
 
     async def _call_with_reauth(self, fn: Callable[[], Awaitable[T]]) -> T:
-        """Run an API call, retrying once on session expiry."""
+        """Run an API call, retrying once on session expiry.
+
+        *fn* must acquire its session via :meth:`ensure_session`, which
+        re-authenticates on the retry after the session is invalidated.
+        The session is only invalidated if it is still the one *fn* ran
+        with, so concurrent calls that all hit the expiry share the
+        single re-login of whichever got there first.
+        """
+        session = await self.ensure_session()
         try:
             return await fn()
         except BydSessionExpiredError:
-            self.invalidate_session()
-            await self.ensure_session()
+            if self._session is session:
+                self.invalidate_session()
             return await fn()
 
     async def _authed_call(
@@ -239,15 +394,117 @@ class BydClient:
         Most simple endpoints follow an identical pattern: acquire session
         and transport, call an API function, retry on session expiry.
         This helper eliminates the per-method inner closure boilerplate.
+        The transport does not change across a retry, so it is resolved
+        once up front; only the session is re-acquired.
         """
+        config = self._config
+        transport = self._require_transport()
 
         async def _call() -> T:
             session = await self.ensure_session()
-            transport = self._require_transport()
-            return await fn(self._config, session, transport, *args, **kwargs)
+            return await fn(config, session, transport, *args, **kwargs)
 
         return await self._call_with_reauth(_call)
 
+    def _get_fresh(self, model_cls: type[_M], vin: str, max_age: float | None) -> _M | None:
+        """Return the last fetched *model_cls* for *vin* if younger than *max_age* seconds."""
+        if max_age is None:
+            return None
+        entry = self._last_reads.get((model_cls, vin))
+        if entry is None:
+            return None
+        fetched_at, value = entry
+        if time.monotonic() - fetched_at >= max_age or not isinstance(value, model_cls):
+            return None
+        return value
+
+    def _remember(self, vin: str, value: _M) -> _M:
+        """Record *value* as the latest fetched model of its type for *vin*."""
+        self._last_reads[(type(value), vin)] = (time.monotonic(), value)
+        return value
+
+    def _forget(self, vin: str) -> None:
+        """Drop every remembered read for *vin* (its state may have changed).
+
+        Reads for *vin* already in flight are neither remembered nor
+        joined by later callers.
+        """
+        self._read_generations[vin] = self._read_generations.get(vin, 0) + 1
+        for key in [key for key in self._last_reads if key[1] == vin]:
+            del self._last_reads[key]
+
+    async def _read(
+        self,
+        model_cls: type[_M],
+        vin: str,
+        stale_after: float | None,
+        fetch: Callable[[], Awaitable[_M]],
+    ) -> _M:
+        """Return a fresh-enough *model_cls* for *vin*, fetching it at most once.
+
+        A result younger than *stale_after* is served from memory.
+        Otherwise, if the same read is already in flight, the caller
+        joins it instead of issuing a duplicate request.
+        """
+        cached = self._get_fresh(model_cls, vin, stale_after)
+        if cached is not None:
+            return cached
+        generation = self._read_generations.get(vin, 0)
+
+        async def _fetch() -> _M:
+            value = await fetch()
+            if self._read_generations.get(vin, 0) == generation:
+                self._remember(vin, value)
+            return value
+
+        return await self._single_flight((model_cls, vin, generation), _fetch)
+
+    async def _single_flight(self, key: Hashable, factory: Callable[[], Coroutine[Any, Any, T]]) -> T:
+        """Run *factory* once per *key* at a time; concurrent callers share its result.
+
+        The call is shielded from any single caller giving up, and is
+        cancelled once every caller waiting on it has been cancelled; a
+        caller arriving after that starts a fresh call instead of joining
+        the dying one.
+        """
+        flight = self._inflight.get(key)
+        if flight is None:
+            task = asyncio.create_task(factory())
+            flight = self._inflight[key] = _InFlight(task)
+            task.add_done_callback(functools.partial(self._on_inflight_done, key))
+        flight.waiters += 1
+        try:
+            result: T = await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.task.done():
+                if self._inflight.get(key) is flight:
+                    del self._inflight[key]
+                flight.task.cancel()
+        return result
+
+    async def _fan_out(
+        self,
+        vins: Iterable[str],
+        fetch: Callable[[str], Awaitable[T]],
+    ) -> dict[str, T | BaseException]:
+        """Run *fetch* for every VIN concurrently, keyed by VIN.
+
+        A failure for one VIN is returned in its slot instead of
+        cancelling the others.  HTTP concurrency stays bounded by the
+        transport's ``max_concurrent_requests``.
+        """
+        unique = list(dict.fromkeys(vins))
+        results = await asyncio.gather(*(fetch(vin) for vin in unique), return_exceptions=True)
+        return dict(zip(unique, results, strict=True))
+
+    def _on_inflight_done(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        flight = self._inflight.get(key)
+        if flight is not None and flight.task is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved; waiters re-raise it themselves
+
     # ------------------------------------------------------------------
     # MQTT
     # ------------------------------------------------------------------
@@ -261,7 +518,7 @@ class BydClient:
         session = self._session
         transport = self._transport
         loop = self._loop or asyncio.get_running_loop()
-        if session is None or transport is None:
+        if session is None or transport is None or not transport.is_attached:
             return
         try:
             bootstrap = await fetch_mqtt_bootstrap(self._config, session, transport)
@@ -466,6 +723,8 @@ class BydClient:
         mqtt_timeout: float | None = None,
         poll_attempts: int = 10,
         poll_interval: float = 1.5,
+        poll_backoff: float = 1.0,
+        poll_jitter: float = 0.15,
     ) -> _M:
         """Generic trigger → MQTT wait → HTTP poll fallback.
 
@@ -480,6 +739,9 @@ class BydClient:
             Pydantic model to ``model_validate`` the final dict.
         label
             Human-readable label for debug logging (e.g. ``"Realtime"``).
+        poll_backoff, poll_jitter
+            Growth factor and random spread for the HTTP poll delay; see
+            :func:`pybyd._api._common.poll_delay`.
         """
         session = await self.ensure_session()
         transport = self._require_transport()
@@ -501,6 +763,7 @@ class BydClient:
             return model_cls.model_validate(merged_latest)
 
         # Phase 2: MQTT wait (preferred)
+        triggered_at = time.monotonic()
         mqtt_raw = await self._mqtt_wait(
             vin,
             event_type=mqtt_event_type,
@@ -514,8 +777,12 @@ class BydClient:
         # Phase 3: HTTP poll fallback
         _logger.debug("MQTT timeout; falling back to HTTP polling for %s vin=%s", label, vin)
         for attempt in range(1, poll_attempts + 1):
-            if poll_interval > 0:
-                await asyncio.sleep(poll_interval)
+            delay = poll_delay(attempt, poll_interval, backoff=poll_backoff, jitter=poll_jitter)
+            if attempt == 1:
+                # Time already spent waiting on MQTT counts towards the first poll.
+                delay -= time.monotonic() - triggered_at
+            if delay > 0:
+                await asyncio.sleep(delay)
             try:
                 latest, serial = await fetch_fn(
                     poll_endpoint,
@@ -547,31 +814,45 @@ class BydClient:
         *,
         poll_attempts: int = 10,
         poll_interval: float = 1.5,
+        poll_backoff: float = 1.0,
+        poll_jitter: float = 0.15,
         mqtt_timeout: float | None = None,
+        stale_after: float | None = None,
     ) -> VehicleRealtimeData:
         """Trigger + wait for realtime vehicle data.
 
         Sends a trigger request, then waits up to *mqtt_timeout* seconds
         for an MQTT ``vehicleInfo`` push.  Falls back to HTTP polling of
         ``vehicleRealTimeResult`` only if MQTT doesn't deliver in time.
-        """
 
-        async def _call() -> VehicleRealtimeData:
-            return await self._trigger_and_poll(
-                vin=vin,
-                trigger_endpoint="/vehicleInfo/vehicle/vehicleRealTimeRequest",
-                poll_endpoint="/vehicleInfo/vehicle/vehicleRealTimeResult",
-                fetch_fn=_realtime_api.fetch_realtime_endpoint,
-                is_ready=VehicleRealtimeData.is_ready_raw,
-                model_cls=VehicleRealtimeData,
-                label="Realtime",
-                mqtt_event_type="vehicleInfo",
-                mqtt_timeout=mqtt_timeout,
-                poll_attempts=poll_attempts,
-                poll_interval=poll_interval,
-            )
-
-        return await self._call_with_reauth(_call)
+        When *stale_after* is given and the last reading for *vin* was
+        fetched less than *stale_after* seconds ago, it is returned
+        without any network round-trip.
+        """
+        return await self._read(
+            VehicleRealtimeData,
+            vin,
+            stale_after,
+            functools.partial(
+                self._call_with_reauth,
+                functools.partial(
+                    self._trigger_and_poll,
+                    vin=vin,
+                    trigger_endpoint="/vehicleInfo/vehicle/vehicleRealTimeRequest",
+                    poll_endpoint="/vehicleInfo/vehicle/vehicleRealTimeResult",
+                    fetch_fn=_realtime_api.fetch_realtime_endpoint,
+                    is_ready=VehicleRealtimeData.is_ready_raw,
+                    model_cls=VehicleRealtimeData,
+                    label="Realtime",
+                    mqtt_event_type="vehicleInfo",
+                    mqtt_timeout=mqtt_timeout,
+                    poll_attempts=poll_attempts,
+                    poll_interval=poll_interval,
+                    poll_backoff=poll_backoff,
+                    poll_jitter=poll_jitter,
+                ),
+            ),
+        )
 
     async def get_gps_info(
         self,
@@ -579,42 +860,133 @@ class BydClient:
         *,
         poll_attempts: int = 10,
         poll_interval: float = 1.5,
+        poll_backoff: float = 1.0,
+        poll_jitter: float = 0.15,
         mqtt_timeout: float | None = None,
+        stale_after: float | None = None,
     ) -> GpsInfo:
         """Trigger + wait for GPS info.
 
         Sends a trigger request, then waits for an MQTT push carrying
         the ``requestSerial``.  Falls back to HTTP polling of
         ``getGpsInfoResult`` if MQTT doesn't deliver in time.
+
+        When *stale_after* is given and the last GPS fix for *vin* was
+        fetched less than *stale_after* seconds ago, it is returned
+        without any network round-trip.
         """
+        return await self._read(
+            GpsInfo,
+            vin,
+            stale_after,
+            functools.partial(
+                self._call_with_reauth,
+                functools.partial(
+                    self._trigger_and_poll,
+                    vin=vin,
+                    trigger_endpoint="/control/getGpsInfo",
+                    poll_endpoint="/control/getGpsInfoResult",
+                    fetch_fn=_gps_api.fetch_gps_endpoint,
+                    is_ready=_gps_api.is_gps_info_ready,
+                    model_cls=GpsInfo,
+                    label="GPS",
+                    mqtt_timeout=mqtt_timeout,
+                    poll_attempts=poll_attempts,
+                    poll_interval=poll_interval,
+                    poll_backoff=poll_backoff,
+                    poll_jitter=poll_jitter,
+                ),
+            ),
+        )
 
-        async def _call() -> GpsInfo:
-            return await self._trigger_and_poll(
-                vin=vin,
-                trigger_endpoint="/control/getGpsInfo",
-                poll_endpoint="/control/getGpsInfoResult",
-                fetch_fn=_gps_api.fetch_gps_endpoint,
-                is_ready=_gps_api.is_gps_info_ready,
-                model_cls=GpsInfo,
-                label="GPS",
-                mqtt_timeout=mqtt_timeout,
-                poll_attempts=poll_attempts,
-                poll_interval=poll_interval,
-            )
+    async def get_hvac_status(self, vin: str, *, stale_after: float | None = None) -> HvacStatus:
+        """Fetch HVAC / climate status.
 
-        return await self._call_with_reauth(_call)
+        *stale_after* works as for :meth:`get_vehicle_realtime`.
+        """
+        return await self._read(
+            HvacStatus, vin, stale_after, functools.partial(self._authed_call, _hvac_api.fetch_hvac_status, vin)
+        )
+
+    async def get_charging_status(self, vin: str, *, stale_after: float | None = None) -> ChargingStatus:
+        """Fetch charging status.
+
+        *stale_after* works as for :meth:`get_vehicle_realtime`.
+        """
+        return await self._read(
+            ChargingStatus,
+            vin,
+            stale_after,
+            functools.partial(self._authed_call, _charging_api.fetch_charging_status, vin),
+        )
+
+    async def get_all_status(
+        self,
+        vin: str,
+        *,
+        stale_after: float | None = None,
+    ) -> tuple[HvacStatus, ChargingStatus]:
+        """Fetch HVAC and charging status concurrently."""
+        hvac, charging = await asyncio.gather(
+            self.get_hvac_status(vin, stale_after=stale_after),
+            self.get_charging_status(vin, stale_after=stale_after),
+        )
+        return hvac, charging
+
+    async def get_energy_consumption(self, vin: str, *, stale_after: float | None = None) -> EnergyConsumption:
+        """Fetch energy consumption data.
+
+        *stale_after* works as for :meth:`get_vehicle_realtime`.
+        """
+        return await self._read(
+            EnergyConsumption,
+            vin,
+            stale_after,
+            functools.partial(self._authed_call, _energy_api.fetch_energy_consumption, vin),
+        )
+
+    async def get_vehicle_realtime_many(
+        self, vins: Iterable[str], **kwargs: Any
+    ) -> dict[str, VehicleRealtimeData | BaseException]:
+        """Fetch realtime data for several vehicles concurrently.
+
+        Keyword arguments are passed to :meth:`get_vehicle_realtime`.
+        Returns a mapping of VIN to its result, or to the exception
+        raised for that VIN.
+        """
+        return await self._fan_out(vins, functools.partial(self.get_vehicle_realtime, **kwargs))
+
+    async def get_gps_info_many(self, vins: Iterable[str], **kwargs: Any) -> dict[str, GpsInfo | BaseException]:
+        """Fetch GPS info for several vehicles concurrently.
 
-    async def get_hvac_status(self, vin: str) -> HvacStatus:
-        """Fetch HVAC / climate status."""
-        return await self._authed_call(_hvac_api.fetch_hvac_status, vin)
+        See :meth:`get_vehicle_realtime_many`.
+        """
+        return await self._fan_out(vins, functools.partial(self.get_gps_info, **kwargs))
 
-    async def get_charging_status(self, vin: str) -> ChargingStatus:
-        """Fetch charging status."""
-        return await self._authed_call(_charging_api.fetch_charging_status, vin)
+    async def get_hvac_status_many(self, vins: Iterable[str], **kwargs: Any) -> dict[str, HvacStatus | BaseException]:
+        """Fetch HVAC status for several vehicles concurrently.
 
-    async def get_energy_consumption(self, vin: str) -> EnergyConsumption:
-        """Fetch energy consumption data."""
-        return await self._authed_call(_energy_api.fetch_energy_consumption, vin)
+        See :meth:`get_vehicle_realtime_many`.
+        """
+        return await self._fan_out(vins, functools.partial(self.get_hvac_status, **kwargs))
+
+    async def get_charging_status_many(
+        self, vins: Iterable[str], **kwargs: Any
+    ) -> dict[str, ChargingStatus | BaseException]:
+        """Fetch charging status for several vehicles concurrently.
+
+        See :meth:`get_vehicle_realtime_many`.
+        """
+        return await self._fan_out(vins, functools.partial(self.get_charging_status, **kwargs))
+
+    async def get_energy_consumption_many(
+        self, vins: Iterable[str], **kwargs: Any
+    ) -> dict[str, EnergyConsumption | BaseException]:
+        """Fetch energy consumption for several vehicles concurrently.
+
+        See :meth:`get_vehicle_realtime_many`.
+        """
+        return await self._fan_out(vins, functools.partial(self.get_energy_consumption, **kwargs))
 
     async def get_push_state(self, vin: str) -> PushNotificationState:
         """Fetch push notification state."""
@@ -624,6 +996,20 @@ class BydClient:
         """Enable or disable push notifications."""
         return await self._authed_call(_push_api.set_push_state, vin, enable=enable)
 
+    def set_push_state_nowait(self, vin: str, *, enable: bool) -> asyncio.Task[CommandAck]:
+        """Enable or disable push notifications without waiting for the reply.
+
+        The request is scheduled as a background task and this method
+        returns immediately.  Callers that need the acknowledgement can
+        await the returned task, which raises any failure; a failure no
+        caller retrieves is reported by asyncio as an unretrieved task
+        exception.  Pending tasks are drained by :meth:`async_close`.
+        """
+        task = asyncio.create_task(self.set_push_state(vin, enable=enable))
+        self._pending_writes.add(task)
+        task.add_done_callback(self._pending_writes.discard)
+        return task
+
     # ------------------------------------------------------------------
     # Control commands
     # ------------------------------------------------------------------
@@ -645,10 +1031,18 @@ class BydClient:
         *,
         control_params: Mapping[str, Any] | ControlParams | None = None,
         command_pwd: str | None = None,
-        poll_attempts: int = 10,
-        poll_interval: float = 1.5,
+        poll: PollOptions | None = None,
     ) -> RemoteControlResult:
-        """Internal: send a remote command and poll/wait for result."""
+        """Internal: send a remote command and poll/wait for result.
+
+        Resolves the control PIN, so the public command wrappers only
+        need to name their :class:`RemoteCommand` and parameters.
+        Reads remembered for *vin* are discarded once the command has
+        run, so ``stale_after`` never serves pre-command state.
+        """
+        pwd = self._require_command_pwd(command_pwd)
+        if poll is None:
+            poll = _DEFAULT_POLL
         params_dict: dict[str, Any] | None = None
         if control_params is not None:
             if isinstance(control_params, ControlParams):
@@ -665,43 +1059,42 @@ class BydClient:
                 return None
             return RemoteControlResult.model_validate(raw)
 
-        async def _call() -> RemoteControlResult:
-            session = await self.ensure_session()
-            transport = self._require_transport()
-            return await _control_api.poll_remote_control(
-                self._config,
-                session,
-                transport,
+        try:
+            return await self._authed_call(
+                _control_api.poll_remote_control,
                 vin,
                 command,
                 control_params=params_dict,
-                command_pwd=command_pwd,
-                poll_attempts=poll_attempts,
-                poll_interval=poll_interval,
+                command_pwd=pwd,
+                poll_attempts=poll.attempts,
+                poll_interval=poll.interval,
+                poll_backoff=poll.backoff,
+                poll_jitter=poll.jitter,
+                first_poll_delay=poll.first_delay,
                 mqtt_result_waiter=_mqtt_result_waiter,
             )
-
-        return await self._call_with_reauth(_call)
+        finally:
+            self._forget(vin)
 
     async def lock(
         self,
         vin: str,
         *,
         command_pwd: str | None = None,
+        poll: PollOptions | None = None,
     ) -> RemoteControlResult:
         """Lock the vehicle."""
-        pwd = self._require_command_pwd(command_pwd)
-        return await self._remote_control(vin, RemoteCommand.LOCK, command_pwd=pwd)
+        return await self._remote_control(vin, RemoteCommand.LOCK, command_pwd=command_pwd, poll=poll)
 
     async def unlock(
         self,
         vin: str,
         *,
         command_pwd: str | None = None,
+        poll: PollOptions | None = None,
     ) -> RemoteControlResult:
         """Unlock the vehicle."""
-        pwd = self._require_command_pwd(command_pwd)
-        return await self._remote_control(vin, RemoteCommand.UNLOCK, command_pwd=pwd)
+        return await self._remote_control(vin, RemoteCommand.UNLOCK, command_pwd=command_pwd, poll=poll)
 
     async def start_climate(
         self,
@@ -709,14 +1102,15 @@ class BydClient:
         *,
         params: ClimateStartParams,
         command_pwd: str | None = None,
+        poll: PollOptions | None = None,
     ) -> RemoteControlResult:
         """Start climate control with the given parameters."""
-        pwd = self._require_command_pwd(command_pwd)
         return await self._remote_control(
             vin,
             RemoteCommand.START_CLIMATE,
             control_params=params,
-            command_pwd=pwd,
+            command_pwd=command_pwd,
+            poll=poll,
         )
 
     async def stop_climate(
@@ -724,40 +1118,40 @@ class BydClient:
         vin: str,
         *,
         command_pwd: str | None = None,
+        poll: PollOptions | None = None,
     ) -> RemoteControlResult:
         """Stop climate control."""
-        pwd = self._require_command_pwd(command_pwd)
-        return await self._remote_control(vin, RemoteCommand.STOP_CLIMATE, command_pwd=pwd)
+        return await self._remote_control(vin, RemoteCommand.STOP_CLIMATE, command_pwd=command_pwd, poll=poll)
 
     async def flash_lights(
         self,
         vin: str,
         *,
         command_pwd: str | None = None,
+        poll: PollOptions | None = None,
     ) -> RemoteControlResult:
         """Flash vehicle lights."""
-        pwd = self._require_command_pwd(command_pwd)
-        return await self._remote_control(vin, RemoteCommand.FLASH_LIGHTS, command_pwd=pwd)
+        return await self._remote_control(vin, RemoteCommand.FLASH_LIGHTS, command_pwd=command_pwd, poll=poll)
 
     async def close_windows(
         self,
         vin: str,
         *,
         command_pwd: str | None = None,
+        poll: PollOptions | None = None,
     ) -> RemoteControlResult:
         """Close all windows."""
-        pwd = self._require_command_pwd(command_pwd)
-        return await self._remote_control(vin, RemoteCommand.CLOSE_WINDOWS, command_pwd=pwd)
+        return await self._remote_control(vin, RemoteCommand.CLOSE_WINDOWS, command_pwd=command_pwd, poll=poll)
 
     async def find_car(
         self,
         vin: str,
         *,
         command_pwd: str | None = None,
+        poll: PollOptions | None = None,
     ) -> RemoteControlResult:
         """Activate find-my-car (horn + lights)."""
-        pwd = self._require_command_pwd(command_pwd)
-        return await self._remote_control(vin, RemoteCommand.FIND_CAR, command_pwd=pwd)
+        return await self._remote_control(vin, RemoteCommand.FIND_CAR, command_pwd=command_pwd, poll=poll)
 
     async def schedule_climate(
         self,
@@ -765,14 +1159,15 @@ class BydClient:
         *,
         params: ClimateScheduleParams,
         command_pwd: str | None = None,
+        poll: PollOptions | None = None,
     ) -> RemoteControlResult:
         """Schedule climate control."""
-        pwd = self._require_command_pwd(command_pwd)
         return await self._remote_control(
             vin,
             RemoteCommand.SCHEDULE_CLIMATE,
             control_params=params,
-            command_pwd=pwd,
+            command_pwd=command_pwd,
+            poll=poll,
         )
 
     async def set_seat_climate(
@@ -781,14 +1176,15 @@ class BydClient:
         *,
         params: SeatClimateParams,
         command_pwd: str | None = None,
+        poll: PollOptions | None = None,
     ) -> RemoteControlResult:
         """Set seat heating/ventilation."""
-        pwd = self._require_command_pwd(command_pwd)
         return await self._remote_control(
             vin,
             RemoteCommand.SEAT_CLIMATE,
             control_params=params,
-            command_pwd=pwd,
+            command_pwd=command_pwd,
+            poll=poll,
         )
 
     async def set_battery_heat(
@@ -797,14 +1193,15 @@ class BydClient:
         *,
         params: BatteryHeatParams,
         command_pwd: str | None = None,
+        poll: PollOptions | None = None,
     ) -> RemoteControlResult:
         """Enable or disable battery heating."""
-        pwd = self._require_command_pwd(command_pwd)
         return await self._remote_control(
             vin,
             RemoteCommand.BATTERY_HEAT,
             control_params=params,
-            command_pwd=pwd,
+            command_pwd=command_pwd,
+            poll=poll,
         )
 
     async def save_charging_schedule(
@@ -821,28 +1218,15 @@ class BydClient:
             or schedule.end_minute is None
         ):
             raise ValueError("SmartChargingSchedule must have all time fields set")
-        target_soc = schedule.target_soc
-        start_hour = schedule.start_hour
-        start_minute = schedule.start_minute
-        end_hour = schedule.end_hour
-        end_minute = schedule.end_minute
-
-        async def _call() -> CommandAck:
-            session = await self.ensure_session()
-            transport = self._require_transport()
-            return await _smart_api.save_charging_schedule(
-                self._config,
-                session,
-                transport,
-                vin,
-                target_soc=target_soc,
-                start_hour=start_hour,
-                start_minute=start_minute,
-                end_hour=end_hour,
-                end_minute=end_minute,
-            )
-
-        return await self._call_with_reauth(_call)
+        return await self._authed_call(
+            _smart_api.save_charging_schedule,
+            vin,
+            target_soc=schedule.target_soc,
+            start_hour=schedule.start_hour,
+            start_minute=schedule.start_minute,
+            end_hour=schedule.end_hour,
+            end_minute=schedule.end_minute,
+        )
 
     async def toggle_smart_charging(self, vin: str, *, enable: bool) -> CommandAck:
         """Enable or disable smart charging."""
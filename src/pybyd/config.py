@@ -92,6 +92,14 @@ class BydConfig(BaseModel):
         Seconds to wait for an MQTT reply before falling back to HTTP
         polling.  Applies to all trigger-then-poll endpoints (realtime,
         GPS, remote commands).
+    max_concurrent_requests : int
+        Maximum number of HTTP requests the client keeps in flight at
+        once; further requests wait for a free slot.  Set to ``0`` to
+        disable the limit.
+    warm_up_connection : bool
+        Open the connection to *base_url* in the background as soon as
+        the client starts, so the TLS handshake is done before the first
+        login.
     device : DeviceProfile
         Device identity fields.
     """
@@ -119,6 +127,8 @@ class BydConfig(BaseModel):
     mqtt_enabled: bool = True
     mqtt_keepalive: int = 120
     mqtt_timeout: float = 10.0
+    max_concurrent_requests: int = Field(default=4, ge=0)
+    warm_up_connection: bool = False
     device: DeviceProfile = Field(default_factory=DeviceProfile)
 
     @classmethod
@@ -9,6 +9,7 @@ from pybyd.models.control import (
     ClimateStartParams,
     CommandAck,
     ControlState,
+    PollOptions,
     RemoteCommand,
     RemoteControlResult,
     SeatClimateParams,
@@ -58,6 +59,7 @@ __all__ = [
     "HvacStatus",
     "LockState",
     "OnlineState",
+    "PollOptions",
     "PowerGear",
     "PushNotificationState",
     "RemoteCommand",
@@ -91,6 +91,32 @@ class RemoteControlResult(BydBaseModel):
         return merged
 
 
+class PollOptions(BaseModel):
+    """How a remote command waits for its ``remoteControlResult``.
+
+    Accepted as ``poll=`` by every command that returns a
+    :class:`RemoteControlResult`; the defaults poll every 1.5s (±15%) up
+    to 10 times.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    attempts: int = Field(default=10, ge=1)
+    """Maximum number of result polls."""
+
+    interval: float = Field(default=1.5, ge=0.0)
+    """Delay before each poll, in seconds; the base of the schedule when *backoff* is set."""
+
+    backoff: float = Field(default=1.0, ge=1.0)
+    """Factor the delay grows by per poll (1.0 keeps it fixed)."""
+
+    jitter: float = Field(default=0.15, ge=0.0, lt=1.0)
+    """Fraction each delay is spread by, so independent clients don't poll in lockstep."""
+
+    first_delay: float | None = Field(default=None, ge=0.0)
+    """Delay before the first poll when it should come sooner than *interval*."""
+
+
 # ------------------------------------------------------------------
 # Command acknowledgement responses
 # ------------------------------------------------------------------
@@ -161,10 +187,10 @@ class ClimateStartParams(ControlParams):
     to BYD's internal scale (1-17) on serialisation.
     """
 
-    temperature: float | None = Field(default=None, ge=15.0, le=31.0)
+    temperature: float | None = Field(default=None, ge=15.0, le=31.0, serialization_alias="mainSettingTemp")
     """Driver temperature setpoint in °C (15-31)."""
 
-    copilot_temperature: float | None = Field(default=None, ge=15.0, le=31.0)
+    copilot_temperature: float | None = Field(default=None, ge=15.0, le=31.0, serialization_alias="copilotSettingTemp")
     """Passenger temperature setpoint in °C (15-31)."""
 
     cycle_mode: int | None = Field(default=None, ge=0)
@@ -184,16 +210,6 @@ class ClimateStartParams(ControlParams):
     def _serialize_temp(self, value: float | None) -> int | None:
         return celsius_to_scale(value) if value is not None else None
 
-    def to_control_params_map(self) -> dict[str, Any]:
-        """Return a dict that can be JSON-encoded into ``controlParamsMap``."""
-        data = self.model_dump(by_alias=True, exclude_none=True)
-        # Map temperature fields to BYD's expected keys.
-        if "temperature" in data:
-            data["mainSettingTemp"] = data.pop("temperature")
-        if "copilotTemperature" in data:
-            data["copilotSettingTemp"] = data.pop("copilotTemperature")
-        return data
-
 
 class ClimateScheduleParams(ClimateStartParams):
     """Parameters for scheduling HVAC (commandType ``BOOKINGAIR``)."""
@@ -225,17 +241,18 @@ class SeatClimateParams(ControlParams):
     rr_seat_ventilation: int | None = Field(default=None, ge=0, le=3)
     steering_wheel_heat: int | None = Field(default=None, ge=0, le=1)
 
-    # Mapping from model attribute names → constructor keyword arguments.
-    _SEAT_ATTR_TO_PARAM: ClassVar[dict[str, str]] = {
-        "main_seat_heat_state": "main_heat",
-        "main_seat_ventilation_state": "main_ventilation",
-        "copilot_seat_heat_state": "copilot_heat",
-        "copilot_seat_ventilation_state": "copilot_ventilation",
-        "lr_seat_heat_state": "lr_seat_heat",
-        "lr_seat_ventilation_state": "lr_seat_ventilation",
-        "rr_seat_heat_state": "rr_seat_heat",
-        "rr_seat_ventilation_state": "rr_seat_ventilation",
-    }
+    # (model attribute name, constructor keyword argument) pairs; only
+    # ever iterated, so a flat tuple rather than a dict.
+    _SEAT_ATTR_TO_PARAM: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("main_seat_heat_state", "main_heat"),
+        ("main_seat_ventilation_state", "main_ventilation"),
+        ("copilot_seat_heat_state", "copilot_heat"),
+        ("copilot_seat_ventilation_state", "copilot_ventilation"),
+        ("lr_seat_heat_state", "lr_seat_heat"),
+        ("lr_seat_ventilation_state", "lr_seat_ventilation"),
+        ("rr_seat_heat_state", "rr_seat_heat"),
+        ("rr_seat_ventilation_state", "rr_seat_ventilation"),
+    )
 
     @classmethod
     def from_current_state(
@@ -257,7 +274,7 @@ class SeatClimateParams(ControlParams):
 
         kwargs: dict[str, int] = {}
 
-        for attr, param in cls._SEAT_ATTR_TO_PARAM.items():
+        for attr, param in cls._SEAT_ATTR_TO_PARAM:
             val = None
             if hvac is not None:
                 val = getattr(hvac, attr, None)
@@ -286,4 +303,4 @@ class BatteryHeatParams(ControlParams):
 
     @field_serializer("on")
     def _serialize_on(self, value: bool) -> int:
-        return 1 if value else 0
+        return int(value)
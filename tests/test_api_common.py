@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from pybyd._api._common import poll_delay
+
+
+def test_poll_delay_defaults_to_fixed_interval() -> None:
+    assert [poll_delay(n, 1.5) for n in (1, 2, 5)] == [1.5, 1.5, 1.5]
+    assert poll_delay(3, 0) == 0.0
+
+
+def test_poll_delay_backs_off_up_to_cap_with_jitter() -> None:
+    assert poll_delay(1, 1.0, backoff=2.0) == 1.0
+    assert poll_delay(3, 1.0, backoff=2.0) == 4.0
+    assert poll_delay(10, 1.0, backoff=2.0, max_interval=5.0) == 5.0
+    for _ in range(20):
+        assert 0.8 <= poll_delay(1, 1.0, jitter=0.2) <= 1.2
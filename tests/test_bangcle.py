@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from pybyd._crypto._bangcle_block import decrypt_cbc, encrypt_cbc
+from pybyd._crypto.bangcle import BangcleCodec
+
+_PLAINTEXT = '{"vin":"TESTVIN","code":"0"}'
+# Produced by the original struct-based port of bangcle.js.
+_ENVELOPE = "F3/zLWuxQu78TjWI4hSHtoztG9wsiBEMEHrFUzWluWXI="
+
+
+@pytest.fixture(scope="module")
+def codec() -> BangcleCodec:
+    return BangcleCodec()
+
+
+def test_encode_envelope_matches_known_vector(codec: BangcleCodec) -> None:
+    assert codec.encode_envelope(_PLAINTEXT) == _ENVELOPE
+
+
+def test_decode_envelope_matches_known_vector(codec: BangcleCodec) -> None:
+    assert codec.decode_envelope(_ENVELOPE) == _PLAINTEXT.encode()
+
+
+def test_cbc_round_trip_with_iv(codec: BangcleCodec) -> None:
+    tables = codec._load_tables()
+    data = os.urandom(64)
+    iv = os.urandom(16)
+    assert decrypt_cbc(tables, encrypt_cbc(tables, data, iv), iv) == data
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+# pylint: disable=redefined-outer-name
+import asyncio
+import functools
+
+import pytest
+
+from pybyd.client import BydClient
+from pybyd.config import BydConfig
+
+
+@pytest.fixture
+def config() -> BydConfig:
+    return BydConfig(username="user@example.com", password="secret", mqtt_enabled=False)
+
+
+def test_resolve_command_pwd_accepts_digest_or_pin() -> None:
+    config = BydConfig(username="user@example.com", password="secret", control_pin="123456")
+    client = BydClient(config)
+    digest = "e10adc3949ba59abbe56e057f20f883e"
+    assert client._resolve_command_pwd(f" {digest} ") == digest.upper()
+    assert client._resolve_command_pwd("123456") == digest.upper()
+    assert client._resolve_command_pwd(None) == digest.upper()
+    assert client._resolve_command_pwd("z" * 32) != "Z" * 32
+
+
+async def _cancellable_call(started: asyncio.Event, cancelled: asyncio.Event) -> int:
+    started.set()
+    try:
+        await asyncio.sleep(10)
+    except asyncio.CancelledError:
+        cancelled.set()
+        raise
+    return 1
+
+
+@pytest.mark.asyncio
+async def test_shared_call_cancelled_with_its_last_waiter(config: BydConfig) -> None:
+    started, cancelled = asyncio.Event(), asyncio.Event()
+    factory = functools.partial(_cancellable_call, started, cancelled)
+    async with BydClient(config) as client:
+        first = asyncio.create_task(client._single_flight("key", factory))
+        second = asyncio.create_task(client._single_flight("key", factory))
+        await started.wait()
+
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+        assert not cancelled.is_set()
+
+        second.cancel()
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        await asyncio.gather(second, return_exceptions=True)
+        assert not client._inflight
+
+
+@pytest.mark.asyncio
+async def test_late_caller_does_not_join_a_cancelled_shared_call(config: BydConfig) -> None:
+    started = asyncio.Event()
+
+    async def slow_to_cancel() -> int:
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            await asyncio.sleep(0.05)
+            raise
+        return 1
+
+    async def fresh() -> int:
+        return 2
+
+    async with BydClient(config) as client:
+        abandoned = asyncio.create_task(client._single_flight("key", slow_to_cancel))
+        await started.wait()
+        abandoned.cancel()
+        await asyncio.gather(abandoned, return_exceptions=True)
+
+        assert await client._single_flight("key", fresh) == 2
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_shared_calls(config: BydConfig) -> None:
+    started, cancelled = asyncio.Event(), asyncio.Event()
+    async with BydClient(config) as client:
+        waiter = asyncio.create_task(
+            client._single_flight("key", functools.partial(_cancellable_call, started, cancelled))
+        )
+        await started.wait()
+    assert cancelled.is_set()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pybyd._transport import SecureTransport
+from pybyd.client import BydClient
+from pybyd.config import BydConfig
+from pybyd.exceptions import BydError, BydTransportError
+
+
+@pytest.fixture
+def config() -> BydConfig:
+    return BydConfig(username="user@example.com", password="secret", mqtt_enabled=False)
+
+
+@pytest.mark.asyncio
+async def test_owned_session_uses_tuned_connector(config: BydConfig) -> None:
+    client = BydClient(config)
+    async with client:
+        http = client._http_session
+        assert http is not None
+        connector = http.connector
+        assert isinstance(connector, aiohttp.TCPConnector)
+        assert connector.limit == BydClient._HTTP_POOL_LIMIT
+        assert connector.limit_per_host == BydClient._HTTP_POOL_LIMIT_PER_HOST
+        assert connector.use_dns_cache is True
+        assert http.timeout.total == BydClient._HTTP_TOTAL_TIMEOUT_S
+        assert isinstance(http.cookie_jar, aiohttp.DummyCookieJar)
+    assert connector.closed
+
+
+@pytest.mark.asyncio
+async def test_shared_connector_is_not_closed_with_client(config: BydConfig) -> None:
+    connector = aiohttp.TCPConnector()
+    try:
+        async with BydClient(config, connector=connector) as client:
+            assert client._http_session is not None
+            assert client._http_session.connector is connector
+        assert not connector.closed
+    finally:
+        await connector.close()
+
+
+@pytest.mark.asyncio
+async def test_explicit_cookie_jar_is_used(config: BydConfig) -> None:
+    jar = aiohttp.CookieJar(unsafe=True)
+    async with BydClient(config, cookie_jar=jar) as client:
+        assert client._http_session is not None
+        assert client._http_session.cookie_jar is jar
+
+
+@pytest.mark.asyncio
+async def test_clients_share_one_codec(config: BydConfig) -> None:
+    async with BydClient(config) as first, BydClient(config) as second:
+        assert first._codec is not None
+        assert first._codec is second._codec
+
+
+@pytest.mark.asyncio
+async def test_reentered_client_keeps_its_transport(config: BydConfig) -> None:
+    client = BydClient(config)
+    async with client:
+        transport = client._transport
+        assert transport is not None
+        assert transport.is_attached
+    assert not transport.is_attached
+    with pytest.raises(BydError, match="not initialized"):
+        client._require_transport()
+    async with client:
+        assert client._require_transport() is transport
+
+
+@pytest.mark.asyncio
+async def test_warm_up_connection_opens_connection_on_start() -> None:
+    heads: list[str] = []
+
+    async def handle_head(request: web.Request) -> web.Response:
+        heads.append(request.path)
+        return web.Response(status=404)
+
+    app = web.Application()
+    app.router.add_route("HEAD", "/", handle_head)
+    async with TestServer(app) as server:
+        config = BydConfig(
+            username="user@example.com",
+            password="secret",
+            base_url=str(server.make_url("/")),
+            warm_up_connection=True,
+        )
+        async with BydClient(config) as client:
+            assert client._warm_up_task is not None
+            await client._warm_up_task
+        assert client._warm_up_task is None
+
+    assert heads == ["/"]
+
+
+@pytest.mark.asyncio
+async def test_login_does_not_wait_for_a_stalled_warm_up(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def handle_head(_request: web.Request) -> web.Response:
+        await asyncio.sleep(10)
+        return web.Response(status=404)
+
+    app = web.Application()
+    app.router.add_route("HEAD", "/", handle_head)
+    monkeypatch.setattr(BydClient, "_WARM_UP_WAIT_S", 0.05)
+    async with TestServer(app) as server:
+        config = BydConfig(
+            username="user@example.com",
+            password="secret",
+            base_url=str(server.make_url("")).rstrip("/"),
+            mqtt_enabled=False,
+            warm_up_connection=True,
+        )
+        async with BydClient(config) as client:
+            with pytest.raises(BydTransportError):
+                await asyncio.wait_for(client.login(), timeout=1)
+            assert client._warm_up_task is not None
+            assert not client._warm_up_task.done()
+
+
+@pytest.mark.asyncio
+async def test_request_timeout_raises_transport_error() -> None:
+    async def handle_post(_request: web.Request) -> web.Response:
+        await asyncio.sleep(1)
+        return web.Response(text="{}")
+
+    app = web.Application()
+    app.router.add_post("/x", handle_post)
+    async with TestServer(app) as server:
+        base_url = str(server.make_url("")).rstrip("/")
+        config = BydConfig(username="user@example.com", password="secret", base_url=base_url)
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=0.05)) as http:
+            transport = SecureTransport(config, _PlainCodec(), http)  # type: ignore[arg-type]
+            with pytest.raises(BydTransportError, match="timed out"):
+                await transport.post_secure("/x", {})
+
+
+class _SlowResponse:
+    status = 200
+
+    def __init__(self, tracker: _ConcurrencyTracker) -> None:
+        self._tracker = tracker
+
+    async def __aenter__(self) -> _SlowResponse:
+        self._tracker.active += 1
+        self._tracker.peak = max(self._tracker.peak, self._tracker.active)
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        self._tracker.active -= 1
+
+    async def read(self) -> bytes:
+        await asyncio.sleep(0.01)
+        return b"not json"
+
+
+class _ConcurrencyTracker:
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+
+    def post(self, *_args: object, **_kwargs: object) -> _SlowResponse:
+        return _SlowResponse(self)
+
+
+class _PlainCodec:
+    def encode_envelope(self, plaintext: str) -> str:
+        return plaintext
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("limit", "expected_peak"), [(2, 2), (0, 5)])
+async def test_transport_caps_requests_in_flight(limit: int, expected_peak: int) -> None:
+    config = BydConfig(username="user@example.com", password="secret", max_concurrent_requests=limit)
+    tracker = _ConcurrencyTracker()
+    transport = SecureTransport(config, _PlainCodec(), tracker)  # type: ignore[arg-type]
+
+    results = await asyncio.gather(*(transport.post_secure("/x", {}) for _ in range(5)), return_exceptions=True)
+
+    assert all(isinstance(result, BydTransportError) for result in results)
+    assert tracker.peak == expected_peak
+
+
+def test_reentered_client_runs_under_a_new_event_loop() -> None:
+    config = BydConfig(username="user@example.com", password="secret", max_concurrent_requests=1)
+    client = BydClient(config, session=_ConcurrencyTracker())  # type: ignore[arg-type]
+
+    async def _contend() -> None:
+        async with client:
+            transport = client._require_transport()
+            requests = await asyncio.gather(
+                *(transport.post_secure("/x", {}) for _ in range(2)), return_exceptions=True
+            )
+            logins = await asyncio.gather(client.ensure_session(), client.ensure_session(), return_exceptions=True)
+        assert all(isinstance(result, BydTransportError) for result in [*requests, *logins])
+
+    asyncio.run(_contend())
+    asyncio.run(_contend())
@@ -6,7 +6,13 @@ import pytest
 
 from pybyd._api.control import _build_control_inner
 from pybyd.config import BydConfig
-from pybyd.models.control import ClimateScheduleParams, ClimateStartParams, RemoteCommand, SeatClimateParams
+from pybyd.models.control import (
+    BatteryHeatParams,
+    ClimateScheduleParams,
+    ClimateStartParams,
+    RemoteCommand,
+    SeatClimateParams,
+)
 
 
 def test_climate_start_params_celsius_to_scale() -> None:
@@ -67,3 +73,8 @@ def test_build_control_inner_serializes_control_params_map_as_json_string() -> N
     assert inner["commandPwd"] == "ABCDEF"
     assert isinstance(inner["controlParamsMap"], str)
     assert json.loads(inner["controlParamsMap"]) == {"mainSettingTemp": 7, "timeSpan": 1}
+
+
+def test_battery_heat_params_serialises_switch_as_int() -> None:
+    assert BatteryHeatParams(on=True).to_control_params_map() == {"batteryHeatSwitch": 1}
+    assert BatteryHeatParams(on=False).to_control_params_map() == {"batteryHeatSwitch": 0}
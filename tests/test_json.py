@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from pybyd import _json
+
+
+def test_dumps_is_compact_and_keeps_non_ascii() -> None:
+    encoded = _json.dumps({"autoAlias": "Mein Wägen", "vin": "VIN123"})
+    assert encoded == '{"autoAlias":"Mein Wägen","vin":"VIN123"}'
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumpb_matches_dumps(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(_json, "orjson", None)
+    payload = {"autoAlias": "Mein Wägen", "n": 1}
+    assert _json.dumpb(payload) == _json.dumps(payload).encode("utf-8")
+
+
+def test_loads_accepts_str_and_bytes() -> None:
+    assert _json.loads('{"code":"0"}') == {"code": "0"}
+    assert _json.loads(b'{"code":"0"}') == {"code": "0"}
+
+
+def test_loads_invalid_raises_stdlib_decode_error() -> None:
+    with pytest.raises(json.JSONDecodeError):
+        _json.loads("not json")
+
+
+def test_stdlib_fallback_matches(monkeypatch: pytest.MonkeyPatch) -> None:
+    payload = {"autoAlias": "Mein Wägen", "n": 1}
+    expected = _json.dumps(payload)
+    monkeypatch.setattr(_json, "orjson", None)
+    assert _json.dumps(payload) == expected
+    assert _json.loads(expected) == payload
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_sort_keys(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(_json, "orjson", None)
+    assert _json.dumps({"b": 1, "a": 2}, sort_keys=True) == '{"a":2,"b":1}'
@@ -3,24 +3,30 @@ from __future__ import annotations
 # pylint: disable=redefined-outer-name
 import asyncio
 import json
+import logging
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from types import SimpleNamespace
 from typing import Any
 
 import pytest
 
+from pybyd._api import control as control_api
 from pybyd._api.control import _fetch_control_endpoint, verify_control_password
 from pybyd._constants import SESSION_EXPIRED_CODES
 from pybyd._mqtt import MqttEvent
 from pybyd.client import BydClient
 from pybyd.config import BydConfig
-from pybyd.exceptions import BydApiError, BydAuthenticationError, BydRemoteControlError
+from pybyd.exceptions import BydApiError, BydAuthenticationError, BydRemoteControlError, BydSessionExpiredError
 from pybyd.models.charging import ChargingStatus
-from pybyd.models.control import RemoteCommand
+from pybyd.models.control import PollOptions, RemoteCommand
+from pybyd.models.energy import EnergyConsumption
+from pybyd.models.hvac import HvacStatus
 from pybyd.models.realtime import VehicleRealtimeData
 from pybyd.models.realtime import VehicleState as RealtimeVehicleState
 from pybyd.models.smart_charging import SmartChargingSchedule
+from pybyd.models.token import AuthToken
 from pybyd.session import Session
 
 
@@ -303,6 +309,29 @@ async def test_e2e_client_happy_path_exercises_full_library(config: BydConfig, e
     assert e2e_backend.calls.get("/control/remoteControlResult", 0) == 0
 
 
+@pytest.mark.asyncio
+@pytest.mark.e2e
+async def test_e2e_command_wrappers_forward_poll_options(
+    config: BydConfig,
+    e2e_backend: FakeBydBackend,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr(control_api, "asyncio", SimpleNamespace(sleep=fake_sleep))
+    no_mqtt_config = config.model_copy(update={"mqtt_enabled": False})
+
+    async with BydClient(no_mqtt_config) as client:
+        result = await client.lock(e2e_backend.vin, poll=PollOptions(first_delay=0.25, jitter=0.0))
+        assert result.success is True
+
+    assert len(sleeps) == 1
+    assert 0 < sleeps[0] <= 0.25
+
+
 @pytest.mark.asyncio
 @pytest.mark.e2e
 async def test_e2e_login_error_raises_authentication(config: BydConfig, e2e_backend: FakeBydBackend) -> None:
@@ -349,6 +378,224 @@ async def test_e2e_remote_control_falls_back_to_poll_when_mqtt_times_out(
     assert e2e_backend.calls.get("/control/remoteControlResult", 0) == 1
 
 
+@pytest.mark.asyncio
+@pytest.mark.e2e
+async def test_e2e_stale_after_serves_fresh_reads_from_memory(
+    config: BydConfig,
+    e2e_backend: FakeBydBackend,
+) -> None:
+    async with BydClient(config) as client:
+        vin = e2e_backend.vin
+        first = await client.get_vehicle_realtime(vin, poll_attempts=1, poll_interval=0, mqtt_timeout=0)
+        second = await client.get_vehicle_realtime(vin, stale_after=60)
+        assert second is first
+
+        gps = await client.get_gps_info(vin, poll_attempts=1, poll_interval=0)
+        assert await client.get_gps_info(vin, stale_after=60) is gps
+
+        refreshed = await client.get_vehicle_realtime(
+            vin, poll_attempts=1, poll_interval=0, mqtt_timeout=0, stale_after=0
+        )
+        assert refreshed is not first
+
+        hvac = await client.get_hvac_status(vin)
+        assert await client.get_hvac_status(vin, stale_after=60) is hvac
+        charging = await client.get_charging_status(vin)
+        assert await client.get_all_status(vin, stale_after=60) == (hvac, charging)
+
+    assert e2e_backend.calls.get("/vehicleInfo/vehicle/vehicleRealTimeRequest", 0) == 2
+    assert e2e_backend.calls.get("/control/getGpsInfo", 0) == 1
+    assert e2e_backend.calls.get("/control/getStatusNow", 0) == 1
+    assert e2e_backend.calls.get("/control/smartCharge/homePage", 0) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.e2e
+async def test_e2e_persisted_auth_token_skips_login(config: BydConfig, e2e_backend: FakeBydBackend) -> None:
+    saved: list[AuthToken] = []
+    async with BydClient(config, on_auth_token=saved.append) as client:
+        await client.get_vehicles()
+    assert len(saved) == 1
+    assert e2e_backend.calls.get("/app/account/login", 0) == 1
+
+    async with BydClient(config, auth_token=saved[0]) as client:
+        assert len(await client.get_vehicles()) == 1
+    assert e2e_backend.calls.get("/app/account/login", 0) == 1
+
+    # A token the API no longer accepts falls back to a regular login.
+    e2e_backend.expire_once_endpoints.add("/app/account/getAllListByUserId")
+    async with BydClient(config, auth_token=saved[0]) as client:
+        assert len(await client.get_vehicles()) == 1
+    assert e2e_backend.calls.get("/app/account/login", 0) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.e2e
+async def test_e2e_persisted_auth_token_is_not_reused_after_login(
+    config: BydConfig,
+    e2e_backend: FakeBydBackend,
+) -> None:
+    saved: list[AuthToken] = []
+    async with BydClient(config, on_auth_token=saved.append) as client:
+        await client.login()
+
+    async with BydClient(config, auth_token=saved[0]) as client:
+        await client.login()
+        client.invalidate_session()
+        await client.get_vehicles()
+    assert e2e_backend.calls.get("/app/account/login", 0) == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.e2e
+async def test_e2e_concurrent_identical_reads_share_one_request(
+    config: BydConfig,
+    e2e_backend: FakeBydBackend,
+) -> None:
+    async with BydClient(config) as client:
+        vin = e2e_backend.vin
+        await client.login()
+        first, second = await asyncio.gather(client.get_hvac_status(vin), client.get_hvac_status(vin))
+        assert first is second
+        energy = await asyncio.gather(*(client.get_energy_consumption(vin) for _ in range(3)))
+        assert all(item is energy[0] for item in energy)
+        assert not client._inflight
+
+        await client.get_hvac_status(vin)
+
+    assert e2e_backend.calls.get("/control/getStatusNow", 0) == 2
+    assert e2e_backend.calls.get("/vehicleInfo/vehicle/getEnergyConsumption", 0) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.e2e
+async def test_e2e_expiry_after_concurrent_relogin_keeps_new_session(
+    config: BydConfig,
+    e2e_backend: FakeBydBackend,
+) -> None:
+    async with BydClient(config) as client:
+        await client.login()
+        fresh = _make_session()
+        attempts = 0
+
+        async def _call() -> Session:
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                # Another caller re-authenticated while this request was on the wire.
+                client._session = fresh
+                raise BydSessionExpiredError("session expired", code="1005")
+            return await client.ensure_session()
+
+        assert await client._call_with_reauth(_call) is fresh
+
+    assert e2e_backend.calls.get("/app/account/login", 0) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.e2e
+async def test_e2e_many_vins_fetched_concurrently(config: BydConfig, e2e_backend: FakeBydBackend) -> None:
+    async with BydClient(config) as client:
+        vin = e2e_backend.vin
+        statuses = await client.get_hvac_status_many([vin, vin])
+        assert list(statuses) == [vin]
+        assert isinstance(statuses[vin], HvacStatus)
+        energy = await client.get_energy_consumption_many([vin])
+        assert isinstance(energy[vin], EnergyConsumption)
+
+        async def _fetch(target: str) -> HvacStatus:
+            if target != vin:
+                raise BydApiError("unknown vehicle", code="1001", endpoint="/control/getStatusNow")
+            return await client.get_hvac_status(target)
+
+        mixed = await client._fan_out([vin, "VIN-UNKNOWN"], _fetch)
+        assert isinstance(mixed[vin], HvacStatus)
+        assert isinstance(mixed["VIN-UNKNOWN"], BydApiError)
+
+
+@pytest.mark.asyncio
+@pytest.mark.e2e
+async def test_e2e_cancelled_command_is_not_sent_after_rate_limit_wait(
+    config: BydConfig,
+    e2e_backend: FakeBydBackend,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sent = 0
+    rate_limited = asyncio.Event()
+
+    async def fake_fetch(endpoint: str, *_args: Any, **_kwargs: Any) -> tuple[dict[str, Any], str]:
+        nonlocal sent
+        sent += 1
+        rate_limited.set()
+        raise BydApiError("previous command still in progress", code="6024", endpoint=endpoint)
+
+    monkeypatch.setattr(control_api, "_fetch_control_endpoint", fake_fetch)
+    async with BydClient(config) as client:
+        unlock = asyncio.create_task(client.unlock(e2e_backend.vin))
+        await rate_limited.wait()
+        unlock.cancel()
+        await asyncio.gather(unlock, return_exceptions=True)
+        await asyncio.sleep(0.05)
+        assert not client._inflight
+
+    assert sent == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.e2e
+async def test_e2e_remote_command_discards_remembered_reads(config: BydConfig, e2e_backend: FakeBydBackend) -> None:
+    async with BydClient(config) as client:
+        vin = e2e_backend.vin
+        hvac = await client.get_hvac_status(vin)
+        assert await client.get_hvac_status(vin, stale_after=60) is hvac
+
+        await client._remote_control(vin, RemoteCommand.STOP_CLIMATE, poll=PollOptions(interval=0))
+        assert await client.get_hvac_status(vin, stale_after=60) is not hvac
+
+    assert e2e_backend.calls.get("/control/getStatusNow", 0) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.e2e
+async def test_e2e_read_in_flight_during_command_is_not_remembered(
+    config: BydConfig,
+    e2e_backend: FakeBydBackend,
+) -> None:
+    started, release = asyncio.Event(), asyncio.Event()
+    post_secure = e2e_backend.post_secure
+
+    async def gated_post_secure(endpoint: str, outer_payload: dict[str, Any]) -> dict[str, Any]:
+        if endpoint == "/control/getStatusNow" and not release.is_set():
+            started.set()
+            await release.wait()
+        return await post_secure(endpoint, outer_payload)
+
+    e2e_backend.post_secure = gated_post_secure  # type: ignore[method-assign]
+    async with BydClient(config) as client:
+        vin = e2e_backend.vin
+        await client.login()
+        before = asyncio.create_task(client.get_hvac_status(vin))
+        await started.wait()
+
+        await client._remote_control(vin, RemoteCommand.STOP_CLIMATE, poll=PollOptions(interval=0))
+        release.set()
+        stale = await before
+        assert await client.get_hvac_status(vin, stale_after=60) is not stale
+
+    assert e2e_backend.calls.get("/control/getStatusNow", 0) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.e2e
+async def test_e2e_get_all_status_shares_one_login(config: BydConfig, e2e_backend: FakeBydBackend) -> None:
+    async with BydClient(config) as client:
+        hvac, charging = await client.get_all_status(e2e_backend.vin)
+
+    assert hvac.is_ac_on is not None
+    assert charging.soc == 84
+    assert e2e_backend.calls.get("/app/account/login", 0) == 1
+
+
 @pytest.mark.asyncio
 @pytest.mark.e2e
 async def test_client_full_workflow(config: BydConfig, e2e_backend: FakeBydBackend) -> None:
@@ -503,6 +750,69 @@ async def test_verify_control_password_accepts_empty_decrypted_payload(monkeypat
     assert result.ok is None
 
 
+@pytest.mark.asyncio
+async def test_remote_control_first_poll_credits_mqtt_wait(monkeypatch: pytest.MonkeyPatch) -> None:
+    responses = iter([({"controlState": 0}, "CMD-1"), ({"controlState": 1}, "CMD-1")])
+    clock = iter([100.0, 102.0])
+    sleeps: list[float] = []
+
+    async def fake_fetch(*_args: Any, **_kwargs: Any) -> tuple[dict[str, Any], str]:
+        return next(responses)
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    async def no_mqtt_result(_serial: str | None) -> None:
+        return None
+
+    monkeypatch.setattr(control_api, "_fetch_control_endpoint", fake_fetch)
+    monkeypatch.setattr(control_api, "time", SimpleNamespace(monotonic=lambda: next(clock)))
+    monkeypatch.setattr(control_api, "asyncio", SimpleNamespace(sleep=fake_sleep))
+
+    result = await control_api.poll_remote_control(
+        BydConfig(username="user@example.com", password="secret"),
+        _make_session(),
+        _ErrorTransport("0"),
+        "VIN-E2E-123",
+        RemoteCommand.LOCK,
+        poll_interval=1.5,
+        mqtt_result_waiter=no_mqtt_result,
+    )
+
+    assert result.success is True
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_remote_control_first_poll_delay_shortens_first_wait(monkeypatch: pytest.MonkeyPatch) -> None:
+    responses = iter([({"controlState": 0}, "CMD-1"), ({"controlState": 0}, "CMD-1"), ({"controlState": 1}, "CMD-1")])
+    sleeps: list[float] = []
+
+    async def fake_fetch(*_args: Any, **_kwargs: Any) -> tuple[dict[str, Any], str]:
+        return next(responses)
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr(control_api, "_fetch_control_endpoint", fake_fetch)
+    monkeypatch.setattr(control_api, "time", SimpleNamespace(monotonic=lambda: 100.0))
+    monkeypatch.setattr(control_api, "asyncio", SimpleNamespace(sleep=fake_sleep))
+
+    result = await control_api.poll_remote_control(
+        BydConfig(username="user@example.com", password="secret"),
+        _make_session(),
+        _ErrorTransport("0"),
+        "VIN-E2E-123",
+        RemoteCommand.LOCK,
+        poll_interval=1.5,
+        poll_jitter=0.0,
+        first_poll_delay=0.5,
+    )
+
+    assert result.success is True
+    assert sleeps == [0.5, 1.5]
+
+
 # ---------------------------------------------------------------------------
 # Unit tests: normalization and constants
 # ---------------------------------------------------------------------------
@@ -662,6 +972,33 @@ async def test_set_push_state_disable(config: BydConfig, push_backend: FakePushN
         assert result.raw == {"result": "ok"}
 
 
+@pytest.mark.asyncio
+async def test_set_push_state_nowait_is_drained_on_close(
+    config: BydConfig,
+    push_backend: FakePushNotificationsBackend,
+) -> None:
+    async with BydClient(config) as client:
+        task = client.set_push_state_nowait(push_backend.vin, enable=True)
+        assert not task.done()
+    assert task.done()
+    assert task.result().result == "ok"
+    assert push_backend.calls.get("/app/push/setPushSwitchState", 0) == 1
+
+
+@pytest.mark.asyncio
+async def test_set_push_state_nowait_failure_is_left_to_the_caller(
+    config: BydConfig,
+    push_backend: FakePushNotificationsBackend,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    push_backend.set_error_code = "9999"
+    async with BydClient(config) as client:
+        task = client.set_push_state_nowait(push_backend.vin, enable=True)
+    with pytest.raises(BydApiError, match="setPushSwitchState"):
+        await task
+    assert not [record for record in caplog.records if record.levelno >= logging.WARNING]
+
+
 @pytest.mark.asyncio
 async def test_set_push_state_api_error(config: BydConfig, push_backend: FakePushNotificationsBackend) -> None:
     push_backend.set_error_code = "9999"